@@ -41,8 +41,24 @@ except ImportError:
     HAS_RICH = False
     print("WARNING: rich not installed. Install with: pip install rich")
 
+# Optional orjson speed-up, same shim as osd_core._json_loads
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 DEBUG = True
 
+# ATA SMART attribute ID -> smart_details key
+_SMART_ATTR_KEYS = {
+    5: 'reallocated_sectors',    # Reallocated_Sector_Ct
+    9: 'power_on_hours',         # Power_On_Hours
+    193: 'load_cycle_count',     # Load_Cycle_Count
+    197: 'pending_sectors',      # Current_Pending_Sector
+    198: 'uncorrectable',        # Offline_Uncorrectable
+}
+
 def debug_print(message):
     """Print debug messages if DEBUG is enabled."""
     if DEBUG:
@@ -57,15 +73,16 @@ def run_command(command, is_json=False, silent=False):
         if not silent:
             debug_print(f"Running: {' '.join(command)}")
 
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
+        # stdout stays bytes for _json_loads (see osd_core.run_command)
+        result = subprocess.run(command, capture_output=True, check=True)
 
         if is_json:
-            return json.loads(result.stdout)
-        return result.stdout.strip()
+            return _json_loads(result.stdout)
+        return result.stdout.decode('utf-8', 'replace').strip()
     except subprocess.CalledProcessError as e:
         if not silent:
             debug_print(f"Command failed: {' '.join(command)}")
-            debug_print(f"Error: {e.stderr}")
+            debug_print(f"Error: {e.stderr.decode('utf-8', 'replace')}")
         return None
     except json.JSONDecodeError as e:
         debug_print(f"JSON decode failed: {e}")
@@ -74,13 +91,15 @@ def run_command(command, is_json=False, silent=False):
 def find_raid_controller():
     """Find the RAID controller device."""
     debug_print("Looking for RAID controller...")
-    for i in range(20):
-        sg_dev = f"/dev/sg{i}"
-        if os.path.exists(sg_dev):
-            info = run_command(["smartctl", "-i", sg_dev], is_json=False, silent=True)
-            if info and ('megaraid' in info.lower() or 'raid' in info.lower() or 'perc' in info.lower()):
-                debug_print(f"Found RAID controller at {sg_dev}")
-                return sg_dev
+    # One readdir, then probe in order until the first controller answers
+    sg_devs = sorted((p for p in Path('/dev').glob('sg*') if p.name[2:].isdigit()),
+                     key=lambda p: int(p.name[2:]))
+    for sg_path in sg_devs:
+        sg_dev = str(sg_path)
+        info = run_command(["smartctl", "-i", sg_dev], is_json=False, silent=True)
+        if info and ('megaraid' in info.lower() or 'raid' in info.lower() or 'perc' in info.lower()):
+            debug_print(f"Found RAID controller at {sg_dev}")
+            return sg_dev
     debug_print("No RAID controller found, defaulting to /dev/sg6")
     return "/dev/sg6"
 
@@ -155,19 +174,9 @@ def extract_smart_details(smart_info):
     # Get SMART attributes (for ATA drives)
     if 'ata_smart_attributes' in smart_info and 'table' in smart_info['ata_smart_attributes']:
         for attr in smart_info['ata_smart_attributes']['table']:
-            attr_id = attr.get('id')
-            raw_value = attr.get('raw', {}).get('value', 0)
-            
-            if attr_id == 5:  # Reallocated_Sector_Ct
-                details['reallocated_sectors'] = raw_value
-            elif attr_id == 9:  # Power_On_Hours
-                details['power_on_hours'] = raw_value
-            elif attr_id == 193:  # Load_Cycle_Count
-                details['load_cycle_count'] = raw_value
-            elif attr_id == 197:  # Current_Pending_Sector
-                details['pending_sectors'] = raw_value
-            elif attr_id == 198:  # Offline_Uncorrectable
-                details['uncorrectable'] = raw_value
+            key = _SMART_ATTR_KEYS.get(attr.get('id'))
+            if key is not None:
+                details[key] = attr.get('raw', {}).get('value', 0)
     
     # For SCSI/SAS drives, look in different location
     if 'scsi_grown_defect_list' in smart_info:
@@ -211,7 +220,7 @@ def get_local_physical_drives(controller_dev, controller_info):
     drives = {}
 
     for phy_id in progress_range:
-        info = run_command(["smartctl", "-j", "-a", "-d", f"megaraid,{phy_id}", controller_dev],
+        info = run_command(["smartctl", "-j", "-i", "-A", "-H", "-d", f"megaraid,{phy_id}", controller_dev],
                           is_json=True, silent=True)
 
         if info and 'serial_number' in info:
@@ -71,6 +71,7 @@ def display_plain_output(data):
     """Display output in plain text format."""
     drives = data['drives']
     osd_to_drive = data['osd_to_drive']
+    drive_to_osd = data['drive_to_osd']
     osd_status = data['osd_status']
     systemd_status = data['systemd_status']
     osd_perf = data['osd_perf']
@@ -93,11 +94,7 @@ def display_plain_output(data):
     rows = []
     for serial, drive in drives.items():
         # Find OSD for this drive
-        osd_id = None
-        for oid, drv_serial in osd_to_drive.items():
-            if drv_serial == serial:
-                osd_id = oid
-                break
+        osd_id = drive_to_osd.get(serial)
         
         # Get data
         if osd_id:
@@ -208,8 +205,7 @@ def display_plain_output(data):
     for serial, drive in drives.items():
         if drive.get('current_device'):
             # Check if this drive is assigned to any OSD
-            is_assigned = any(osd_to_drive.get(oid) == serial for oid in osd_to_drive)
-            if not is_assigned:
+            if serial not in drive_to_osd:
                 drives_available += 1
     
     print(f"\nSummary:")
@@ -272,7 +268,7 @@ def export_csv(data, filename=None):
         filename = f"osd_status_{timestamp}.csv"
     
     drives = data['drives']
-    osd_to_drive = data['osd_to_drive']
+    drive_to_osd = data['drive_to_osd']
     osd_status = data['osd_status']
     systemd_status = data['systemd_status']
     osd_perf = data['osd_perf']
@@ -289,11 +285,7 @@ def export_csv(data, filename=None):
         
         for serial, drive in drives.items():
             # Find OSD
-            osd_id = None
-            for oid, drv_serial in osd_to_drive.items():
-                if drv_serial == serial:
-                    osd_id = oid
-                    break
+            osd_id = drive_to_osd.get(serial)
             
             # Get status
             if osd_id:
@@ -340,7 +332,7 @@ def export_json(data, filename=None):
         filename = f"osd_status_{timestamp}.json"
     
     drives = data['drives']
-    osd_to_drive = data['osd_to_drive']
+    drive_to_osd = data['drive_to_osd']
     osd_status = data['osd_status']
     systemd_status = data['systemd_status']
     osd_perf = data['osd_perf']
@@ -349,11 +341,7 @@ def export_json(data, filename=None):
     
     for serial, drive in drives.items():
         # Find OSD
-        osd_id = None
-        for oid, drv_serial in osd_to_drive.items():
-            if drv_serial == serial:
-                osd_id = oid
-                break
+        osd_id = drive_to_osd.get(serial)
         
         # Get status
         if osd_id:
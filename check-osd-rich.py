@@ -50,7 +50,7 @@ def build_dataframe(data):
         return None
     
     drives = data['drives']
-    osd_to_drive = data['osd_to_drive']
+    drive_to_osd = data['drive_to_osd']
     osd_status = data['osd_status']
     systemd_status = data['systemd_status']
     osd_perf = data['osd_perf']
@@ -59,11 +59,7 @@ def build_dataframe(data):
     
     for serial, drive in drives.items():
         # Find OSD
-        osd_id = None
-        for oid, drv_serial in osd_to_drive.items():
-            if drv_serial == serial:
-                osd_id = oid
-                break
+        osd_id = drive_to_osd.get(serial)
         
         # Get status
         if osd_id:
@@ -165,6 +161,7 @@ def display_rich_output(data):
     # Build rows
     drives = data['drives']
     osd_to_drive = data['osd_to_drive']
+    drive_to_osd = data['drive_to_osd']
     osd_status = data['osd_status']
     systemd_status = data['systemd_status']
     osd_perf = data['osd_perf']
@@ -177,11 +174,7 @@ def display_rich_output(data):
     
     for serial, drive in sorted_drives:
         # Find OSD
-        osd_id = None
-        for oid, drv_serial in osd_to_drive.items():
-            if drv_serial == serial:
-                osd_id = oid
-                break
+        osd_id = drive_to_osd.get(serial)
         
         # Format OSD ID
         osd_text = str(osd_id) if osd_id else "[dim]N/A[/dim]"
@@ -15,51 +15,106 @@ import json
 import sys
 import os
 import re
+import logging
 from datetime import datetime
+from pathlib import Path
+
+# Optional orjson speed-up, same shim as osd_core._json_loads
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 DEBUG = True  # Set to False to reduce output
 
-def debug_print(message):
-    """Print debug messages if DEBUG is enabled."""
-    if DEBUG:
-        print(f"[DEBUG] {message}", file=sys.stderr)
+# Precompiled patterns for the per-line parsers below
+_WORD_PREFIX_RE = re.compile(r'^(\w+)')
+_LSSCSI_RE = re.compile(r'\[([^\]]+)\]\s+(\w+)\s+(\S+)\s+(\S+)\s+\S+\s+(/dev/\w+)')
+
+# ATA SMART attribute ID -> smart_details key
+_SMART_ATTR_KEYS = {
+    5: 'reallocated_sectors',    # Reallocated_Sector_Ct
+    9: 'power_on_hours',         # Power_On_Hours
+    193: 'load_cycle_count',     # Load_Cycle_Count
+    197: 'pending_sectors',      # Current_Pending_Sector
+    198: 'uncorrectable',        # Offline_Uncorrectable
+}
+
+# Same list as osd_core._SUDO_CMDS
+_SUDO_CMDS = frozenset({'ceph', 'pvs', 'lvs', 'systemctl'})
+
+# Logging is set up as in osd_core: the handler is only attached when DEBUG is on
+log = logging.getLogger('check_osd')
+if DEBUG:
+    log.setLevel(logging.DEBUG)
+    _log_handler = logging.StreamHandler(sys.stderr)
+    _log_handler.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
+    log.addHandler(_log_handler)
+
+def run_command(command, is_json=False, silent=False, check=True):
+    """
+    Helper function to run shell commands and return output.
 
-def run_command(command, is_json=False, silent=False):
-    """Helper function to run shell commands and return output."""
+    With check=False a non-zero exit status is not treated as failure and
+    stdout is returned anyway (e.g. systemctl is-active with inactive units).
+    """
     try:
-        if len(command) > 0 and command[0] in ['ceph', 'pvs', 'lvs', 'systemctl'] and command[0] != 'sudo':
-            command.insert(0, 'sudo')
+        if command and command[0] in _SUDO_CMDS and os.geteuid() != 0:
+            command = ['sudo', '-n', *command]
 
         if not silent:
-            debug_print(f"Running: {' '.join(command)}")
+            log.debug("Running: %s", ' '.join(command))
 
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
+        # stdout stays bytes for _json_loads (see osd_core.run_command)
+        result = subprocess.run(command, capture_output=True, check=check)
 
         if is_json:
-            return json.loads(result.stdout)
-        return result.stdout.strip()
+            return _json_loads(result.stdout)
+        return result.stdout.decode('utf-8', 'replace').strip()
     except subprocess.CalledProcessError as e:
         if not silent:
-            debug_print(f"Command failed: {' '.join(command)}")
-            debug_print(f"Error: {e.stderr}")
+            log.debug("Command failed: %s", ' '.join(command))
+            log.debug("Error: %s", e.stderr.decode('utf-8', 'replace'))
         return None
     except json.JSONDecodeError as e:
-        debug_print(f"JSON decode failed: {e}")
+        log.debug("JSON decode failed: %s", e)
         return None
 
 def find_raid_controller():
     """Find the RAID controller device."""
-    debug_print("Looking for RAID controller...")
-    for i in range(20):
-        sg_dev = f"/dev/sg{i}"
-        if os.path.exists(sg_dev):
-            info = run_command(["smartctl", "-i", sg_dev], is_json=False, silent=True)
-            if info and ('megaraid' in info.lower() or 'raid' in info.lower() or 'perc' in info.lower()):
-                debug_print(f"Found RAID controller at {sg_dev}")
-                return sg_dev
-    debug_print("No RAID controller found, defaulting to /dev/sg6")
+    log.debug("Looking for RAID controller...")
+    # One readdir instead of testing sg0..sg19 one by one; probing stays
+    # sequential because we stop at the first controller
+    sg_devs = sorted((p for p in Path('/dev').glob('sg*') if p.name[2:].isdigit()),
+                     key=lambda p: int(p.name[2:]))
+    for sg_path in sg_devs:
+        sg_dev = str(sg_path)
+        info = run_command(["smartctl", "-i", sg_dev], is_json=False, silent=True)
+        if info and ('megaraid' in info.lower() or 'raid' in info.lower() or 'perc' in info.lower()):
+            log.debug("Found RAID controller at %s", sg_dev)
+            return sg_dev
+    log.debug("No RAID controller found, defaulting to /dev/sg6")
     return "/dev/sg6"
 
+def scan_megaraid_targets():
+    """
+    Enumerate drives behind MegaRAID controllers with a single smartctl scan.
+    Returns: [(device, type)] e.g. [('/dev/bus/0', 'megaraid,7')], or [] if unsupported.
+    """
+    scan = run_command(["smartctl", "--scan", "-d", "megaraid", "-j"], is_json=True, silent=True)
+    if not scan:
+        return []
+
+    targets = []
+    for dev in scan.get('devices', []):
+        dev_type = dev.get('type', '')
+        if dev.get('name') and dev_type.startswith('megaraid,'):
+            targets.append((dev['name'], dev_type))
+
+    log.debug("smartctl --scan found %d MegaRAID drive(s)", len(targets))
+    return targets
+
 def extract_smart_details(smart_info):
     """Extract key SMART attributes from smartctl JSON output."""
     details = {
@@ -78,19 +133,9 @@ def extract_smart_details(smart_info):
     # Get SMART attributes (for ATA drives)
     if 'ata_smart_attributes' in smart_info and 'table' in smart_info['ata_smart_attributes']:
         for attr in smart_info['ata_smart_attributes']['table']:
-            attr_id = attr.get('id')
-            raw_value = attr.get('raw', {}).get('value', 0)
-            
-            if attr_id == 5:  # Reallocated_Sector_Ct
-                details['reallocated_sectors'] = raw_value
-            elif attr_id == 9:  # Power_On_Hours
-                details['power_on_hours'] = raw_value
-            elif attr_id == 193:  # Load_Cycle_Count
-                details['load_cycle_count'] = raw_value
-            elif attr_id == 197:  # Current_Pending_Sector
-                details['pending_sectors'] = raw_value
-            elif attr_id == 198:  # Offline_Uncorrectable
-                details['uncorrectable'] = raw_value
+            key = _SMART_ATTR_KEYS.get(attr.get('id'))
+            if key is not None:
+                details[key] = attr.get('raw', {}).get('value', 0)
     
     # For SCSI/SAS drives, look in different location
     if 'scsi_grown_defect_list' in smart_info:
@@ -125,11 +170,18 @@ def get_local_physical_drives():
     print("STEP 1: Scanning Local Hardware")
     print("="*80)
 
-    controller_dev = find_raid_controller()
+    # Probe only the PHYs smartctl reports as populated; fall back to
+    # brute-forcing every slot when autodetection isn't available
+    targets = scan_megaraid_targets()
+    if not targets:
+        controller_dev = find_raid_controller()
+        targets = [(controller_dev, f"megaraid,{phy_id}") for phy_id in range(32)]
+
     drives = {}
 
-    for phy_id in range(32):
-        info = run_command(["smartctl", "-j", "-a", "-d", f"megaraid,{phy_id}", controller_dev],
+    for dev, dev_type in targets:
+        phy_id = int(dev_type.split(',', 1)[1])
+        info = run_command(["smartctl", "-j", "-i", "-A", "-H", "-d", dev_type, dev],
                           is_json=True, silent=True)
 
         if info and 'serial_number' in info:
@@ -139,7 +191,7 @@ def get_local_physical_drives():
 
             # Extract vendor from model if not separate
             if not vendor and model:
-                vendor_match = re.match(r'^(\w+)', model)
+                vendor_match = _WORD_PREFIX_RE.match(model)
                 if vendor_match:
                     vendor = vendor_match.group(1)
 
@@ -180,7 +232,7 @@ def get_local_physical_drives():
                 'size': size,  # Now populated from smartctl
             }
 
-            debug_print(f"PHY {phy_id}: {model} S/N:{serial} Size:{size or 'N/A'}")
+            log.debug("PHY %s: %s S/N:%s Size:%s", phy_id, model, serial, size or 'N/A')
 
     print(f"Found {len(drives)} physical drives on RAID controller")
     return drives
@@ -197,9 +249,24 @@ def map_drives_to_devices(drives):
     # Use lsscsi to get SCSI addresses and model info
     lsscsi_output = run_command(["lsscsi"], is_json=False, silent=True)
 
+    # Serials still waiting for a device name; once empty, the remaining
+    # lsscsi rows can't map anything new so we stop probing them
+    unmapped_serials = {s for s, d in drives.items() if not d.get('current_device')}
+
+    # One lsblk call gives the serial and size of every disk
+    block_devices = {}
+    lsblk_info = run_command(["lsblk", "-J", "-d", "-o", "NAME,SERIAL,SIZE"], is_json=True, silent=True)
+    if lsblk_info:
+        for dev in lsblk_info.get('blockdevices', []):
+            block_devices[dev.get('name')] = dev
+
     if lsscsi_output:
         for line in lsscsi_output.splitlines():
-            match = re.match(r'\[([^\]]+)\]\s+(\w+)\s+(\S+)\s+(\S+)\s+\S+\s+(/dev/\w+)', line)
+            if not unmapped_serials:
+                log.debug("All drives mapped, skipping remaining lsscsi entries")
+                break
+
+            match = _LSSCSI_RE.match(line)
             if match:
                 scsi_addr = match.group(1)
                 dev_type = match.group(2)
@@ -211,28 +278,31 @@ def map_drives_to_devices(drives):
                 if dev_type != 'disk':
                     continue
 
-                # Get serial number to match with our drives
-                info = run_command(["smartctl", "-j", "-i", dev_path], is_json=True, silent=True)
-                if info and 'serial_number' in info:
-                    serial = info['serial_number']
+                # Get serial number to match with our drives; lsblk's is enough
+                # when it's one we know, otherwise ask smartctl (udev's serial
+                # can differ from the drive's own)
+                block_dev = block_devices.get(dev_name, {})
+                serial = block_dev.get('serial')
+                if serial not in drives:
+                    info = run_command(["smartctl", "-j", "-i", dev_path], is_json=True, silent=True)
+                    serial = info.get('serial_number') if info else None
 
-                    if serial in drives:
-                        drives[serial]['current_device'] = dev_name
-                        drives[serial]['scsi_address'] = scsi_addr
+                if serial in drives:
+                    drives[serial]['current_device'] = dev_name
+                    drives[serial]['scsi_address'] = scsi_addr
+                    unmapped_serials.discard(serial)
 
-                        # Update model info from lsscsi (better than smartctl)
-                        if vendor and model:
-                            drives[serial]['model'] = f"{vendor} {model}"
+                    # Update model info from lsscsi (better than smartctl)
+                    if vendor and model:
+                        drives[serial]['model'] = f"{vendor} {model}"
 
-                        # Get size from lsblk (this will override smartctl size if available)
-                        lsblk_info = run_command(["lsblk", "-J", "-o", "NAME,SIZE", dev_path],
-                                                is_json=True, silent=True)
-                        if lsblk_info and 'blockdevices' in lsblk_info:
-                            lsblk_size = lsblk_info['blockdevices'][0].get('size', None)
-                            if lsblk_size:
-                                drives[serial]['size'] = lsblk_size
+                    # Size from lsblk (this will override smartctl size if available)
+                    lsblk_size = block_dev.get('size')
+                    if lsblk_size:
+                        drives[serial]['size'] = lsblk_size
 
-                        debug_print(f"{dev_name}: SCSI {scsi_addr}, Serial {serial}, PHY {drives[serial]['phy_id']}, Size {drives[serial]['size']}")
+                    log.debug("%s: SCSI %s, Serial %s, PHY %s, Size %s",
+                              dev_name, scsi_addr, serial, drives[serial]['phy_id'], drives[serial]['size'])
 
     mapped = sum(1 for d in drives.values() if d.get('current_device'))
     unmapped = len(drives) - mapped
@@ -255,8 +325,8 @@ def get_ceph_osds():
     for osd in metadata:
         osd_id = str(osd.get('id', ''))
         osds[osd_id] = osd
-        debug_print(f"OSD {osd_id}: host={osd.get('hostname', 'unknown')} "
-                   f"device_ids={osd.get('device_ids', 'N/A')}")
+        log.debug("OSD %s: host=%s device_ids=%s", osd_id,
+                  osd.get('hostname', 'unknown'), osd.get('device_ids', 'N/A'))
 
     print(f"Found {len(osds)} OSDs in cluster")
     return osds
@@ -272,21 +342,18 @@ def get_osd_performance():
     
     if output:
         for line in output.splitlines():
-            # Skip header
-            if 'osd' in line and 'commit_latency' in line:
-                continue
-            
-            # Parse lines like: " 51                  61                 61"
-            match = re.match(r'\s*(\d+)\s+(\d+)\s+(\d+)', line)
-            if match:
-                osd_id = match.group(1)
-                commit_lat = int(match.group(2))
-                apply_lat = int(match.group(3))
+            # Parse lines like: " 51                  61                 61";
+            # the header row fails the isdigit() checks
+            parts = line.split()
+            if len(parts) >= 3 and parts[0].isdigit() and parts[1].isdigit() and parts[2].isdigit():
+                osd_id = parts[0]
+                commit_lat = int(parts[1])
+                apply_lat = int(parts[2])
                 perf[osd_id] = {
                     'commit_latency_ms': commit_lat,
                     'apply_latency_ms': apply_lat
                 }
-                debug_print(f"OSD {osd_id}: commit={commit_lat}ms, apply={apply_lat}ms")
+                log.debug("OSD %s: commit=%sms, apply=%sms", osd_id, commit_lat, apply_lat)
     
     print(f"Got performance data for {len(perf)} OSDs")
     return perf
@@ -304,12 +371,10 @@ def parse_device_id(device_ids_string):
         device_name = device_name.strip()
         identifier = identifier.strip()
 
-        parts = identifier.split('_')
-        if len(parts) >= 3:
-            vendor = parts[0]
-            serial = parts[-1]
-            model = '_'.join(parts[1:-1])
-
+        # VENDOR_MODEL_SERIAL - model itself may contain underscores
+        vendor, sep, rest = identifier.partition('_')
+        model, sep2, serial = rest.rpartition('_')
+        if sep and sep2:
             return {
                 'device_name': device_name,
                 'vendor': vendor,
@@ -334,7 +399,7 @@ def match_drives_to_osds(drives, osds):
 
         parsed = parse_device_id(device_ids)
         if not parsed:
-            debug_print(f"OSD {osd_id}: Could not parse device_ids: {device_ids}")
+            log.debug("OSD %s: Could not parse device_ids: %s", osd_id, device_ids)
             continue
 
         osd_serial = parsed['serial']
@@ -342,10 +407,10 @@ def match_drives_to_osds(drives, osds):
         if osd_serial in drives:
             osd_to_drive[osd_id] = osd_serial
             print(f"✓ OSD {osd_id} (on {hostname}): Matched to local drive")
-            debug_print(f"  Serial: {osd_serial}, PHY: {drives[osd_serial]['phy_id']}, "
-                       f"Device: {drives[osd_serial].get('current_device', 'N/A')}")
+            log.debug("  Serial: %s, PHY: %s, Device: %s", osd_serial, drives[osd_serial]['phy_id'],
+                      drives[osd_serial].get('current_device', 'N/A'))
         else:
-            debug_print(f"OSD {osd_id} (on {hostname}): Serial {osd_serial} not found locally")
+            log.debug("OSD %s (on %s): Serial %s not found locally", osd_id, hostname, osd_serial)
 
     print(f"\nMatched {len(osd_to_drive)} OSDs to local drives")
     return osd_to_drive
@@ -358,31 +423,31 @@ def get_osd_status():
 
     status_map = {}
 
-    # Get up/down status from tree
-    tree_output = run_command(["ceph", "osd", "tree"], is_json=False)
-    if tree_output:
-        for line in tree_output.splitlines():
-            match = re.match(r'\s*(\d+)\s+\w+\s+[\d\.]+\s+osd\.\d+\s+(\w+)\s+.*', line)
-            if match:
-                osd_id = match.group(1)
-                up_status = match.group(2)
-                status_map[osd_id] = {
-                    'up': (up_status == 'up'),
-                    'in': None
+    # Get up/down (and, via reweight, in/out) status from tree
+    tree = run_command(["ceph", "osd", "tree", "-f", "json"], is_json=True)
+    if tree:
+        for node in tree.get('nodes', []):
+            # exists=0 marks destroyed/purged OSD ids that linger in the tree
+            if node.get('type') == 'osd' and node.get('exists', 1):
+                # An OSD marked out has its reweight set to 0, so the tree
+                # also tells us in/out
+                reweight = node.get('reweight')
+                status_map[str(node['id'])] = {
+                    'up': (node.get('status') == 'up'),
+                    'in': (reweight > 0) if reweight is not None else None
                 }
 
-    # Get in/out status from dump
-    dump_output = run_command(["ceph", "osd", "dump"], is_json=False)
-    if dump_output:
-        for line in dump_output.splitlines():
-            match = re.search(r'osd\.(\d+)\s+(\w+)\s+(\w+)', line)
-            if match:
-                osd_id = match.group(1)
-                in_status = match.group(3)
-                if osd_id in status_map:
-                    status_map[osd_id]['in'] = (in_status == 'in')
-
-    debug_print(f"Got status for {len(status_map)} OSDs")
+    # Only ask osd dump when the tree didn't settle in/out for every OSD
+    dump = None
+    if not status_map or any(status['in'] is None for status in status_map.values()):
+        dump = run_command(["ceph", "osd", "dump", "-f", "json"], is_json=True)
+    if dump:
+        # The dump also lists OSDs missing from the tree
+        for osd in dump.get('osds', []):
+            status = status_map.setdefault(str(osd.get('osd')), {'up': bool(osd.get('up'))})
+            status['in'] = bool(osd.get('in'))
+
+    log.debug("Got status for %d OSDs", len(status_map))
     return status_map
 
 def check_systemd_status(osd_ids):
@@ -392,21 +457,28 @@ def check_systemd_status(osd_ids):
     print("="*80)
 
     systemd_status = {}
+    osd_ids = list(osd_ids)
+    if not osd_ids:
+        return systemd_status
+
+    # One systemctl call; states come back in argument order
+    units = [f"ceph-osd@{osd_id}.service" for osd_id in osd_ids]
+    result = run_command(["systemctl", "is-active", "--"] + units,
+                       is_json=False, silent=True, check=False)
+    states = result.splitlines() if result else []
 
-    for osd_id in osd_ids:
-        service_name = f"ceph-osd@{osd_id}.service"
-        result = run_command(["systemctl", "is-active", service_name],
-                           is_json=False, silent=True)
+    for i, osd_id in enumerate(osd_ids):
+        state = states[i].strip() if i < len(states) else ''
 
-        if result and result.strip() in ['active', 'activating']:
+        if state in ['active', 'activating']:
             systemd_status[osd_id] = 'active'
-            debug_print(f"OSD {osd_id} systemd: active")
-        elif result and result.strip() in ['inactive', 'failed', 'deactivating']:
+            log.debug("OSD %s systemd: active", osd_id)
+        elif state in ['inactive', 'failed', 'deactivating']:
             systemd_status[osd_id] = 'inactive'
-            debug_print(f"OSD {osd_id} systemd: inactive ({result.strip()})")
+            log.debug("OSD %s systemd: inactive (%s)", osd_id, state)
         else:
             systemd_status[osd_id] = 'unknown'
-            debug_print(f"OSD {osd_id} systemd: unknown")
+            log.debug("OSD %s systemd: unknown", osd_id)
 
     return systemd_status
 
@@ -472,13 +544,12 @@ def format_output(drives, osd_to_drive, osd_status, systemd_status, osd_perf):
     rows = []
     available_drives = []
     
+    # Reverse index so each row's OSD lookup is O(1)
+    drive_to_osd = {s: o for o, s in osd_to_drive.items()}
+
     for serial, drive in drives.items():
         # Find OSD for this drive
-        osd_id = None
-        for oid, drv_serial in osd_to_drive.items():
-            if drv_serial == serial:
-                osd_id = oid
-                break
+        osd_id = drive_to_osd.get(serial)
 
         # Get status
         if osd_id:
@@ -528,28 +599,22 @@ def format_output(drives, osd_to_drive, osd_status, systemd_status, osd_perf):
             'model': model or 'Unknown'
         }
         
+        # Sort by SCSI address, then PHY ID - computed once per row
+        scsi_parts = scsi_addr.split(':')
+        if scsi_addr != 'N/A' and all(p.isdigit() for p in scsi_parts):
+            row['_sortkey'] = (0, tuple(int(p) for p in scsi_parts))
+        elif str(drive['phy_id']).isdigit():
+            row['_sortkey'] = (1, (int(drive['phy_id']),))
+        else:
+            row['_sortkey'] = (2, (999,))
+        
         rows.append(row)
         
         # Track available drives
         if not osd_id and current_dev:
             available_drives.append(row)
 
-    # Sort by SCSI address, then PHY ID
-    def sort_key(row):
-        scsi = row.get('scsi_addr')
-        if scsi and scsi != 'N/A':
-            try:
-                parts = [int(x) for x in scsi.split(':')]
-                return (0, parts)
-            except:
-                pass
-        try:
-            phy_id = int(row['phy_id']) if isinstance(row['phy_id'], str) else row['phy_id']
-            return (1, phy_id)
-        except:
-            return (2, 999)
-
-    rows.sort(key=sort_key)
+    rows.sort(key=lambda r: r['_sortkey'])
 
     # Print header
     print("="*160)
@@ -581,11 +646,19 @@ def format_output(drives, osd_to_drive, osd_status, systemd_status, osd_perf):
     # Summary
     total_drives = len(drives)
     drives_with_osds = len(osd_to_drive)
-    osds_up = sum(1 for oid in osd_to_drive if osd_status.get(oid, {}).get('up', False))
-    osds_down = sum(1 for oid in osd_to_drive if not osd_status.get(oid, {}).get('up', True))
-    osds_in = sum(1 for oid in osd_to_drive if osd_status.get(oid, {}).get('in', False))
-    osds_out = sum(1 for oid in osd_to_drive if not osd_status.get(oid, {}).get('in', True))
-    systemd_active = sum(1 for oid in osd_to_drive if systemd_status.get(oid) == 'active')
+    osds_up = osds_down = osds_in = osds_out = systemd_active = 0
+    for oid in osd_to_drive:
+        status = osd_status.get(oid, {})
+        if status.get('up', False):
+            osds_up += 1
+        if not status.get('up', True):
+            osds_down += 1
+        if status.get('in', False):
+            osds_in += 1
+        if not status.get('in', True):
+            osds_out += 1
+        if systemd_status.get(oid) == 'active':
+            systemd_active += 1
     hw_failed = sum(1 for d in drives.values() if d['health_hw'] == 'FAIL')
     drives_available = len(available_drives)
 
@@ -619,13 +692,7 @@ def format_output(drives, osd_to_drive, osd_status, systemd_status, osd_perf):
         if ((smart.get('reallocated_sectors') or 0) > 0 or 
             (smart.get('pending_sectors') or 0) > 0 or 
             (smart.get('uncorrectable') or 0) > 0):
-            # Find OSD ID
-            osd_id = None
-            for oid, drv_serial in osd_to_drive.items():
-                if drv_serial == serial:
-                    osd_id = oid
-                    break
-            problematic_drives.append((osd_id, drive))
+            problematic_drives.append((drive_to_osd.get(serial), drive))
     
     if problematic_drives:
         print("⚠️  URGENT: Drives with SMART errors (REPLACE IMMEDIATELY!):")
@@ -650,11 +717,10 @@ def format_output(drives, osd_to_drive, osd_status, systemd_status, osd_perf):
         for osd_id, lat in high_latency[:5]:  # Show top 5
             print(f"  OSD {osd_id}: {lat}ms")
             # Find drive info
-            for oid, serial in osd_to_drive.items():
-                if oid == osd_id:
-                    drive = drives[serial]
-                    print(f"    PHY {drive['phy_id']}, Age: {format_age(drive['smart_details'].get('power_on_hours'))}")
-                    break
+            serial = osd_to_drive.get(osd_id)
+            if serial:
+                drive = drives[serial]
+                print(f"    PHY {drive['phy_id']}, Age: {format_age(drive['smart_details'].get('power_on_hours'))}")
     
     print(f"\nStatus Legend: [up/DOWN] [in/OUT] [✓ active / ✗ inactive / ? unknown]")
     print(f"SCSI Address: [Host:Channel:Target:LUN] - Physical location on controller")
@@ -0,0 +1 @@
+check-osd.py
\ No newline at end of file
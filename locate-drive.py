@@ -16,9 +16,22 @@ import subprocess
 import json
 import os
 import shutil
+import time
+from functools import lru_cache
+
+# Optional orjson speed-up, same shim as osd_core._json_loads
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 VERSION = "1.0.3"
 
+# Last `list` scan, reused by on/off lookups so they skip a fresh ceph query
+SCAN_CACHE_FILE = "/run/ceph-osd-monitor/scan.json"
+SCAN_CACHE_TTL = 30  # seconds
+
 
 def check_dependencies():
     """Check if required system packages are installed."""
@@ -52,15 +65,61 @@ def run_command(cmd, silent=False):
         return None
 
 
+def save_scan_cache(data):
+    """Persist scan results so follow-up commands can reuse them."""
+    try:
+        os.makedirs(os.path.dirname(SCAN_CACHE_FILE), exist_ok=True)
+        tmp_file = f"{SCAN_CACHE_FILE}.tmp"
+        with open(tmp_file, "w") as f:
+            # Drive records from osd_core serialize through their to_dict()
+            json.dump({"ts": time.time(), "data": data}, f, default=lambda obj: obj.to_dict())
+        os.replace(tmp_file, SCAN_CACHE_FILE)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def load_scan_cache():
+    """Return cached scan data if it is younger than SCAN_CACHE_TTL, else None."""
+    try:
+        with open(SCAN_CACHE_FILE) as f:
+            cache = _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - cache.get("ts", 0) >= SCAN_CACHE_TTL:
+        return None
+    return cache.get("data")
+
+
+@lru_cache(maxsize=1)
+def all_osd_metadata():
+    """Fetch metadata for every OSD once per run, keyed by OSD id."""
+    metadata = run_command(["ceph", "osd", "metadata", "-f", "json"], silent=True)
+    if not metadata:
+        return {}
+
+    try:
+        return {str(osd["id"]): osd for osd in _json_loads(metadata)}
+    except (ValueError, KeyError, TypeError):
+        return {}
+
+
 def find_device_for_osd(osd_id):
     """Find the /dev/sdX device for an OSD."""
+    # Use a recent `list` scan if there is one
+    cached = load_scan_cache()
+    if cached:
+        serial = cached.get("osd_to_drive", {}).get(str(osd_id))
+        device = cached.get("drives", {}).get(serial, {}).get("current_device") if serial else None
+        if device:
+            return f"/dev/{device}"
+
     # Get OSD metadata
-    metadata = run_command(["ceph", "osd", "metadata", str(osd_id)], silent=True)
-    if not metadata:
+    data = all_osd_metadata().get(str(osd_id))
+    if not data:
         return None
 
     try:
-        data = json.loads(metadata)
         device_ids = data.get("device_ids", "")
         # Parse device_ids like "sda=VENDOR_MODEL_SERIAL"
         for item in device_ids.split(","):
@@ -108,12 +167,14 @@ def list_drives():
         return
 
     monitor = OSDMonitor()
-    data = monitor.scan()
+    data = monitor.scan(parallel=True)
 
     if not data:
         print("Error: Could not scan drives", file=sys.stderr)
         return
 
+    save_scan_cache(data)
+
     print("=" * 100)
     print(
         f"{'Device':<12} {'OSD':<6} {'Serial':<20} {'Model':<30} {'Enclosure Bay':<15}"
@@ -131,13 +192,8 @@ def list_drives():
             device = f"/dev/{device}"
 
         # Find OSD for this drive
-        osd_id = None
-        for oid, ser in data["osd_to_drive"].items():
-            if ser == serial:
-                osd_id = f"OSD.{oid}"
-                break
-        if not osd_id:
-            osd_id = "-"
+        oid = data["drive_to_osd"].get(serial)
+        osd_id = f"OSD.{oid}" if oid else "-"
 
         model = drive.get("model", "Unknown")[:30]
         enclosure_info = "-"
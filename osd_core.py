@@ -17,72 +17,449 @@ Usage:
 
 VERSION = "1.0.3"
 
+import asyncio
 import subprocess
 import json
+import logging
+import multiprocessing
 import sys
 import os
 import re
+import glob
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
+
+# Optional: orjson parses the large smartctl/ceph JSON replies much faster.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 DEBUG = True
 
-def debug_print(message):
-    """Print debug messages if DEBUG is enabled."""
-    if DEBUG:
-        print(f"[DEBUG] {message}", file=sys.stderr)
+# Commands that need root; only wrapped in sudo when we aren't root already
+_SUDO_CMDS = frozenset({'ceph', 'pvs', 'lvs', 'systemctl'})
+_NEED_SUDO = os.geteuid() != 0
+
+# sudo runs non-interactively (-n) against a ticket validated once by prime_sudo()
+_sudo_lock = threading.RLock()
+_sudo_primed = False
+_sudo_attempted = False
+_sudo_reprimed = False
+
+# sysfs class directory used to enumerate SCSI hosts, generic devices and enclosures
+SYSFS_CLASS = "/sys/class"
+
+# Precompiled patterns for the per-line parsers below
+_SG_NUM_RE = re.compile(r'\d+$')
+_LSSCSI_ENCL_SG_RE = re.compile(r'\[(\d+):(\d+):(\d+):(\d+)\]\s+enclosu\s+(\S+)\s+(\S+)\s+(\S+)\s+\S+\s+(/dev/sg\d+)')
+_LSSCSI_ENCL_RE = re.compile(r'\[(\d+):(\d+):(\d+):(\d+)\]\s+enclosu\s+(\S+)\s+(\S+)')
+_LSSCSI_DISK_RE = re.compile(r'\[(\d+):(\d+):(\d+):(\d+)\]\s+disk\s+(\S+)\s+(\S+)\s+(\S+)\s+(/dev/sd\w+)(?:\s+(/dev/sg\d+))?')
+_LSSCSI_FULL_RE = re.compile(r'\[([^\]]+)\]\s+(\w+)\s+(\S+)\s+(\S+)\s+\S+\s+(/dev/\w+)')
+_SES_ELEMENT_RE = re.compile(r'[Ee]lement index:\s*(\d+)')
+_SES_SCSI_ADDR_RE = re.compile(r'SCSI address:\s*(\d+):(\d+):(\d+):(\d+)', re.IGNORECASE)
+_SCSI_ADDR_RE = re.compile(r'\[(\d+):(\d+):(\d+):(\d+)\]')
 
-def run_command(command, is_json=False, silent=False):
-    """Helper function to run shell commands and return output."""
+# Debug output goes through logging so messages are only formatted when
+# DEBUG is on; pass arguments (log.debug("x=%s", x)) rather than f-strings
+log = logging.getLogger('osd_core')
+if DEBUG:
+    log.setLevel(logging.DEBUG)
+    _log_handler = logging.StreamHandler(sys.stderr)
+    _log_handler.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
+    log.addHandler(_log_handler)
+
+def _validate_sudo():
+    """Check for a usable sudo ticket, prompting only when someone can answer."""
+    if subprocess.run(["sudo", "-n", "true"], stdout=subprocess.DEVNULL,
+                      stderr=subprocess.DEVNULL).returncode == 0:
+        return True
+    # `sudo -v` asks for a password even on NOPASSWD accounts whose rules
+    # don't cover every command (verifypw=all), so only try it from the main
+    # thread of an interactive session
+    if sys.stdin.isatty() and threading.current_thread() is threading.main_thread():
+        return subprocess.run(["sudo", "-v"]).returncode == 0
+    return False
+
+def prime_sudo():
+    """
+    Validate sudo credentials once, prompting if necessary.
+    
+    Later privileged calls use `sudo -n` and reuse the cached ticket instead
+    of going through authentication each time. Only the first call does any
+    work; a failed attempt isn't repeated on every scan.
+    
+    Returns:
+        bool: True if sudo is ready (or not needed because we are root)
+    """
+    global _sudo_primed, _sudo_attempted
+    if not _NEED_SUDO:
+        return True
+    with _sudo_lock:
+        if not _sudo_attempted:
+            _sudo_attempted = True
+            _sudo_primed = _validate_sudo()
+        return _sudo_primed
+
+def _reprime_sudo():
+    """Re-validate an expired sudo ticket, at most once per process."""
+    global _sudo_primed, _sudo_reprimed
+    with _sudo_lock:
+        if not _sudo_reprimed:
+            _sudo_reprimed = True
+            _sudo_primed = _validate_sudo()
+        return _sudo_primed
+
+def run_command(command, is_json=False, silent=False, check=True, timeout=None, _retried=False):
+    """
+    Helper function to run shell commands and return output.
+    
+    With check=False a non-zero exit status is not treated as failure and
+    stdout is returned anyway (e.g. systemctl is-active with inactive units).
+    A command still running after timeout seconds is killed and counts as failed.
+    """
     try:
-        if len(command) > 0 and command[0] in ['ceph', 'pvs', 'lvs', 'systemctl'] and command[0] != 'sudo':
-            command.insert(0, 'sudo')
+        if _NEED_SUDO and command and command[0] in _SUDO_CMDS:
+            command = ['sudo', '-n', *command]
 
         if not silent:
-            debug_print(f"Running: {' '.join(command)}")
+            log.debug("Running: %s", ' '.join(command))
 
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
+        # Keep stdout as bytes: both json and orjson parse bytes directly,
+        # so JSON replies skip the str decode entirely
+        result = subprocess.run(command, capture_output=True, check=check, timeout=timeout)
 
         if is_json:
-            return json.loads(result.stdout)
-        return result.stdout.strip()
+            return _json_loads(result.stdout)
+        return result.stdout.decode('utf-8', 'replace').strip()
     except subprocess.CalledProcessError as e:
+        # The cached sudo ticket ran out: re-validate and retry once
+        if (not _retried and command[:2] == ['sudo', '-n']
+                and b'password is required' in (e.stderr or b'') and _reprime_sudo()):
+            return run_command(command[2:], is_json, silent, check, timeout, _retried=True)
         if not silent:
-            debug_print(f"Command failed: {' '.join(command)}")
-            debug_print(f"Error: {e.stderr}")
+            log.debug("Command failed: %s", ' '.join(command))
+            log.debug("Error: %s", e.stderr.decode('utf-8', 'replace'))
+        return None
+    except subprocess.TimeoutExpired:
+        if not silent:
+            log.debug("Command timed out after %ss: %s", timeout, ' '.join(command))
         return None
     except json.JSONDecodeError as e:
-        debug_print(f"JSON decode failed: {e}")
+        log.debug("JSON decode failed: %s", e)
         return None
 
+def _leading_word(text):
+    """Return the leading run of word characters (letters, digits, '_') in text."""
+    i = 0
+    while i < len(text) and (text[i].isalnum() or text[i] == '_'):
+        i += 1
+    return text[:i]
+
+def _probe_drive(probe):
+    """
+    Query SMART data for one MegaRAID slot.
+    
+    Kept at module level so it can be pickled for ProcessPoolExecutor.
+    
+    Args:
+        probe: (controller_dev, phy_id) tuple
+    """
+    controller_dev, phy_id = probe
+    return run_command(
+        ["smartctl", "-j", "-i", "-A", "-H", "-d", f"megaraid,{phy_id}", controller_dev],
+        is_json=True,
+        silent=True
+    )
+
+def _read_sysfs(path):
+    """Return the stripped contents of a sysfs attribute, or None if unreadable."""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def _sg_number(path):
+    """Numeric suffix of an sg device path, for sorting /dev/sg2 before /dev/sg10."""
+    return int(_SG_NUM_RE.search(path).group())
+
+class _Record:
+    """
+    Dict-style access for the scan records below.
+    
+    Frontends written against the old plain-dict drives keep working:
+    drive['model'], drive.get('size', 'N/A') and 'enclosure_slot' in drive.
+    """
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+    
+    def __contains__(self, key):
+        return getattr(self, key, None) is not None
+    
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+# slots=True needs Python 3.10; older interpreters get ordinary records
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
+class SmartDetails(_Record):
+    """Key SMART attributes of one drive (see OSDMonitor.extract_smart_details)."""
+    temperature: Optional[int] = None
+    power_on_hours: Optional[int] = None
+    reallocated_sectors: Optional[int] = None
+    pending_sectors: Optional[int] = None
+    uncorrectable: Optional[int] = None
+    load_cycle_count: Optional[int] = None
+    
+    def to_dict(self):
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+@dataclass(**_SLOTS)
+class Drive(_Record):
+    """One physical drive found by OSDMonitor.scan(), keyed by serial in data['drives']."""
+    phy_id: int
+    serial: str
+    model: str
+    vendor: str
+    health_hw: str
+    smart_details: SmartDetails
+    current_device: Optional[str]
+    scsi_address: str
+    size: Optional[str]
+    controller: str
+    controller_device: str
+    # Only set when an SES enclosure maps the drive to a bay
+    enclosure_slot: Optional[int] = None
+    enclosure_name: Optional[str] = None
+    enclosure_device: Optional[str] = None
+    
+    def to_dict(self):
+        """Plain dict for JSON export; enclosure keys are left out when unmapped."""
+        d = {f.name: getattr(self, f.name) for f in fields(self)}
+        d['smart_details'] = self.smart_details.to_dict()
+        if self.enclosure_slot is None:
+            del d['enclosure_slot'], d['enclosure_name'], d['enclosure_device']
+        return d
+    
+    @classmethod
+    def from_dict(cls, d):
+        """Inverse of to_dict()."""
+        return cls(**{**d, 'smart_details': SmartDetails(**d['smart_details'])})
+
 class OSDMonitor:
     """Core OSD monitoring functionality - pure Python, no dependencies."""
     
-    def __init__(self):
+    # ATA SMART attribute ID -> smart_details key
+    _SMART_ATTR_KEYS = {
+        5: 'reallocated_sectors',
+        9: 'power_on_hours',
+        193: 'load_cycle_count',
+        197: 'pending_sectors',
+        198: 'uncorrectable',
+    }
+    
+    # (divisor, suffix, decimals) for format_size_bytes, largest first;
+    # the last entry also covers anything smaller
+    _SIZE_UNITS = ((1e12, 'T', 1), (1e9, 'G', 0), (1e6, 'M', 0))
+    
+    # Upper bound on concurrent subprocesses (smartctl/ceph/...) during a scan
+    _MAX_WORKERS = 32
+    
+    # Seconds before a ceph query is given up on, so a hung MON can't stall a scan
+    CEPH_TIMEOUT = 60
+    
+    # Drive inventory persisted between runs when inventory_ttl is set
+    INVENTORY_CACHE_FILE = Path("/var/cache/ceph-tools/osd_core.json")
+    # Bump whenever the saved layout (e.g. the Drive fields) changes
+    INVENTORY_VERSION = 1
+    
+    # Controller/enclosure model substring -> (type, is_megaraid), checked in order
+    _CONTROLLER_MODELS = (
+        ('md1400', 'MD1400 JBOD', False),
+        ('md1200', 'MD1200 JBOD', False),
+        ('h730', 'PERC H730', True),
+        ('h830', 'PERC H830', True),
+        ('h740', 'PERC H740', True),
+        ('h840', 'PERC H840', True),
+        ('perc', 'PERC', True),
+        ('megaraid', 'MegaRAID/LSI', True),
+        ('lsi', 'MegaRAID/LSI', True),
+    )
+    
+    def __init__(self, cache_ttl=15.0, inventory_ttl=0):
         self.controllers = []  # Changed from single controller_dev
         self.controller_info = {}
         self.drives = {}
         self.osds = {}
         self.osd_to_drive = {}
+        self.drive_to_osd = {}
         self.osd_status = {}
         self.systemd_status = {}
         self.osd_perf = {}
         self.scan_timestamp = None
         self.enclosures = {}  # SES enclosure devices for LED control
+        self._lsscsi_cache = None  # `lsscsi -g` output lines, shared by the steps of one scan()
+        self._pool = None  # thread pool shared by every fan-out of one scan()
+        self._phy_cache = None  # populated MegaRAID PHY ids, found once per scan()
+        self.cache_ttl = cache_ttl  # seconds a scan() result is reused; 0 disables
+        self._cache = None
+        self._cache_ts = 0.0
+        # scan() keeps per-scan state (_pool, _lsscsi_cache, ...) on self, so
+        # only one may run at a time; _scan_count tells waiters one finished
+        self._scan_lock = threading.Lock()
+        self._scan_count = 0
+        # Seconds the on-disk drive inventory may be reused across runs while
+        # the hardware looks unchanged; SMART data is as old as the inventory,
+        # so this is off (0) by default
+        self.inventory_ttl = inventory_ttl
     
-    def find_raid_controllers(self):
-        """Find ALL RAID controllers and JBOD enclosures."""
-        debug_print("Looking for RAID controller(s)...")
+    @contextmanager
+    def _thread_pool(self, max_workers):
+        """
+        Yield the scan-wide thread pool, or a private one outside scan().
+        
+        Sharing one pool caps the number of concurrent subprocesses across
+        every step, instead of each step spinning up its own threads.
+        """
+        if self._pool is not None:
+            yield self._pool
+        else:
+            with ThreadPoolExecutor(max_workers=max(1, min(self._MAX_WORKERS, max_workers))) as pool:
+                yield pool
+    
+    @staticmethod
+    def classify_controller_model(model):
+        """
+        Identify a controller or JBOD enclosure from its model string.
+        
+        Returns:
+            tuple: (controller_type, is_megaraid), or None if not recognised
+        """
+        model_lower = model.lower()
+        for needle, controller_type, is_megaraid in OSDMonitor._CONTROLLER_MODELS:
+            if needle in model_lower:
+                return controller_type, is_megaraid
+        return None
+    
+    def find_controllers_sysfs(self):
+        """
+        Enumerate controllers and enclosures from sysfs, without smartctl.
+        
+        MegaRAID controllers are recognised by their scsi_host driver and are
+        addressed through the first SCSI generic device on that host. JBOD and
+        other enclosures come from the enclosure class, deduplicated by their
+        logical id (dual-EMM enclosures register twice).
+        
+        Returns:
+            list: controller dicts, empty if sysfs has no usable data
+        """
+        # SCSI generic devices grouped by host number, lowest sg first
+        host_sg = {}
+        for sg_path in sorted(glob.glob(f"{SYSFS_CLASS}/scsi_generic/sg*"), key=_sg_number):
+            hctl = os.path.basename(os.path.realpath(os.path.join(sg_path, 'device')))
+            host = hctl.partition(':')[0]
+            if host.isdigit():
+                host_sg.setdefault(int(host), []).append(sg_path)
+        
         controllers = []
-        seen_serials = set()  # Track controller serials to avoid duplicates
         
-        # Scan wider range to catch JBOD enclosures (like MD1400 at sg24)
-        for i in range(30):
-            sg_dev = f"/dev/sg{i}"
-            if not os.path.exists(sg_dev):
+        for host_path in sorted(glob.glob(f"{SYSFS_CLASS}/scsi_host/host*")):
+            host = int(host_path.rpartition('host')[2])
+            driver = _read_sysfs(os.path.join(host_path, 'proc_name'))
+            if driver != 'megaraid_sas':
+                log.debug("sysfs: host%s uses %s, not a MegaRAID controller", host, driver)
                 continue
-                
-            info = run_command(["smartctl", "-i", sg_dev], is_json=False, silent=True)
+            
+            if host not in host_sg:
+                log.debug("sysfs: MegaRAID host%s has no SCSI generic device, skipping", host)
+                continue
+            
+            sg_path = host_sg[host][0]
+            model = _read_sysfs(os.path.join(sg_path, 'device', 'model')) or 'Unknown'
+            match = self.classify_controller_model(model)
+            controller_type = match[0] if match and match[1] else 'MegaRAID/LSI'
+            
+            controllers.append({
+                'device': f"/dev/{os.path.basename(sg_path)}",
+                'type': controller_type,
+                'model': model,
+                'index': _sg_number(sg_path),
+                'is_megaraid': True,
+                'serial': None
+            })
+        
+        seen_ids = set()
+        for encl_path in sorted(glob.glob(f"{SYSFS_CLASS}/enclosure/*")):
+            sg_paths = sorted(glob.glob(os.path.join(encl_path, 'device', 'scsi_generic', 'sg*')), key=_sg_number)
+            if not sg_paths:
+                continue
+            
+            encl_id = _read_sysfs(os.path.join(encl_path, 'id'))
+            if encl_id and encl_id in seen_ids:
+                log.debug("sysfs: Duplicate enclosure with id %s, skipping", encl_id)
+                continue
+            if encl_id:
+                seen_ids.add(encl_id)
+            
+            model = _read_sysfs(os.path.join(encl_path, 'device', 'model')) or 'Unknown'
+            controller_type, is_megaraid_type = self.classify_controller_model(model) or ('Unknown', False)
+            
+            controllers.append({
+                'device': f"/dev/{os.path.basename(sg_paths[0])}",
+                'type': controller_type,
+                'model': model,
+                'index': _sg_number(sg_paths[0]),
+                'is_megaraid': is_megaraid_type,
+                'serial': encl_id
+            })
+        
+        # Same device order as the smartctl probe
+        controllers.sort(key=lambda c: c['index'])
+        for controller in controllers:
+            log.debug("Found RAID controller at %s: %s (%s) [sysfs]", controller['device'], controller['type'], controller['model'])
+        
+        return controllers
+    
+    def probe_controllers_smartctl(self):
+        """
+        Find controllers by probing every SCSI generic device with smartctl -i.
+        
+        Fallback for systems where sysfs does not expose the SCSI topology.
+        """
+        controllers = []
+        seen_serials = set()  # Track controller serials to avoid duplicates
+        
+        # Probe every SCSI generic device that exists (this also catches JBOD
+        # enclosures like MD1400 at sg24); the smartctl -i calls run concurrently
+        sg_devs = sorted(glob.glob('/dev/sg*'), key=_sg_number)
+        with self._thread_pool(len(sg_devs)) as executor:
+            infos = list(executor.map(
+                lambda dev: run_command(["smartctl", "-i", dev], is_json=False, silent=True),
+                sg_devs
+            ))
+        
+        # Classify in device order so duplicate detection stays deterministic
+        for sg_dev, info in zip(sg_devs, infos):
+            i = _sg_number(sg_dev)
             
             if not info:
                 continue
@@ -91,7 +468,7 @@ class OSDMonitor:
             
             # Debug: show what we found
             first_line = info.split('\n')[0] if info else 'empty'
-            debug_print(f"Checking {sg_dev}: {first_line}")
+            log.debug("Checking %s: %s", sg_dev, first_line)
             
             # Check if this is a controller/enclosure we want to track
             is_raid = 'megaraid' in info_lower or 'raid' in info_lower or 'perc' in info_lower
@@ -111,32 +488,9 @@ class OSDMonitor:
                             model = line.split(':', 1)[1].strip()
                             controller_model = model
                             
-                            # Check for JBOD/SAS expander enclosures
-                            if 'md1400' in model.lower():
-                                controller_type = 'MD1400 JBOD'
-                                is_megaraid_type = False
-                            elif 'md1200' in model.lower():
-                                controller_type = 'MD1200 JBOD'
-                                is_megaraid_type = False
-                            # Identify specific Dell PERC models
-                            elif 'h730' in model.lower():
-                                controller_type = 'PERC H730'
-                                is_megaraid_type = True
-                            elif 'h830' in model.lower():
-                                controller_type = 'PERC H830'
-                                is_megaraid_type = True
-                            elif 'h740' in model.lower():
-                                controller_type = 'PERC H740'
-                                is_megaraid_type = True
-                            elif 'h840' in model.lower():
-                                controller_type = 'PERC H840'
-                                is_megaraid_type = True
-                            elif 'perc' in model.lower():
-                                controller_type = 'PERC'
-                                is_megaraid_type = True
-                            elif 'megaraid' in model.lower() or 'lsi' in model.lower():
-                                controller_type = 'MegaRAID/LSI'
-                                is_megaraid_type = True
+                            match = self.classify_controller_model(model)
+                            if match:
+                                controller_type, is_megaraid_type = match
                     
                     elif 'serial number' in line_lower:
                         if ':' in line:
@@ -144,7 +498,7 @@ class OSDMonitor:
                 
                 # Skip duplicate controllers (same serial = same physical controller)
                 if controller_serial and controller_serial in seen_serials:
-                    debug_print(f"{sg_dev}: Duplicate controller with S/N {controller_serial}, skipping")
+                    log.debug("%s: Duplicate controller with S/N %s, skipping", sg_dev, controller_serial)
                     continue
                 
                 if controller_serial:
@@ -158,11 +512,24 @@ class OSDMonitor:
                     'is_megaraid': is_megaraid_type,
                     'serial': controller_serial
                 })
-                debug_print(f"Found RAID controller at {sg_dev}: {controller_type} ({controller_model})")
+                log.debug("Found RAID controller at %s: %s (%s)", sg_dev, controller_type, controller_model)
+        
+        return controllers
+    
+    def find_raid_controllers(self):
+        """Find ALL RAID controllers and JBOD enclosures."""
+        log.debug("Looking for RAID controller(s)...")
+        
+        # sysfs reads are essentially free; only fall back to probing every
+        # sg device with smartctl when sysfs has nothing to offer
+        controllers = self.find_controllers_sysfs()
+        if not controllers:
+            log.debug("sysfs reported no controllers, probing SCSI generic devices...")
+            controllers = self.probe_controllers_smartctl()
         
         if not controllers:
-            debug_print("No RAID controllers or JBOD enclosures found!")
-            debug_print("Will attempt to scan all available disk devices directly...")
+            log.debug("No RAID controllers or JBOD enclosures found!")
+            log.debug("Will attempt to scan all available disk devices directly...")
             # Create a pseudo-controller for direct disk scanning
             controllers = [{
                 'device': 'direct',
@@ -173,10 +540,22 @@ class OSDMonitor:
                 'serial': None
             }]
         else:
-            debug_print(f"Total controllers found: {len(controllers)}")
+            log.debug("Total controllers found: %s", len(controllers))
         
         return controllers
     
+    def _get_lsscsi_lines(self):
+        """
+        Return `lsscsi -g` output as a list of lines, or None if it failed.
+        
+        The command runs and the output is split at most once per scan.
+        """
+        if self._lsscsi_cache is None:
+            output = run_command(["lsscsi", "-g"], is_json=False, silent=True)
+            if output:
+                self._lsscsi_cache = output.splitlines()
+        return self._lsscsi_cache
+    
     def find_ses_enclosures(self):
         """
         Find SCSI Enclosure Services (SES) devices for LED control and bay mapping.
@@ -186,21 +565,21 @@ class OSDMonitor:
         """
         enclosures = {}
         
-        debug_print("Looking for SES enclosure devices...")
+        log.debug("Looking for SES enclosure devices...")
         
         # Find enclosure devices from lsscsi
-        lsscsi_output = run_command(["lsscsi", "-g"], is_json=False, silent=True)
-        if not lsscsi_output:
+        lsscsi_lines = self._get_lsscsi_lines()
+        if not lsscsi_lines:
             return enclosures
         
-        for line in lsscsi_output.splitlines():
+        for line in lsscsi_lines:
             if 'enclosu' in line.lower():
                 # Parse: [7:0:7:0]   enclosu DELL     MD1400           1.07  -          /dev/sg10
                 # Note: The dash is where a block device would be for a disk
-                match = re.match(r'\[(\d+):(\d+):(\d+):(\d+)\]\s+enclosu\s+(\S+)\s+(\S+)\s+(\S+)\s+\S+\s+(/dev/sg\d+)', line)
+                match = _LSSCSI_ENCL_SG_RE.match(line)
                 if not match:
                     # Try without the dash and sg device
-                    match = re.match(r'\[(\d+):(\d+):(\d+):(\d+)\]\s+enclosu\s+(\S+)\s+(\S+)', line)
+                    match = _LSSCSI_ENCL_RE.match(line)
                 
                 if match:
                     host = int(match.group(1))
@@ -215,7 +594,7 @@ class OSDMonitor:
                             'host': host,
                             'slots': {}
                         }
-                        debug_print(f"Found SES enclosure: {sg_dev} - {vendor} {model} on host {host}")
+                        log.debug("Found SES enclosure: %s - %s %s on host %s", sg_dev, vendor, model, host)
                         
                         # Try to get slot information from sg_ses
                         self._map_enclosure_slots(enclosures[host])
@@ -229,18 +608,18 @@ class OSDMonitor:
         """
         sg_dev = enclosure['device']
         
-        debug_print(f"  Querying SES data from {sg_dev}...")
+        log.debug("  Querying SES data from %s...", sg_dev)
         
         # Run sg_ses to get slot information
         # sg_ses output format varies, so we'll try to parse it
         ses_output = run_command(["sg_ses", sg_dev], is_json=False, silent=True)
         
         if not ses_output:
-            debug_print(f"  ⚠ Could not query SES info from {sg_dev} - sg_ses may not be installed")
-            debug_print(f"  Install with: apt install sg3-utils")
+            log.debug("  ⚠ Could not query SES info from %s - sg_ses may not be installed", sg_dev)
+            log.debug("  Install with: apt install sg3-utils")
             return
         
-        debug_print(f"  Successfully queried {sg_dev}, parsing slot mappings...")
+        log.debug("  Successfully queried %s, parsing slot mappings...", sg_dev)
         
         # Parse sg_ses output to find array devices and their slots
         # Different enclosures format this differently, so we try multiple patterns
@@ -251,30 +630,30 @@ class OSDMonitor:
         for line in ses_output.splitlines():
             # Look for element index (slot number)
             if 'Element index:' in line or 'element index:' in line.lower():
-                match = re.search(r'[Ee]lement index:\s*(\d+)', line)
+                match = _SES_ELEMENT_RE.search(line)
                 if match:
                     current_slot = int(match.group(1))
             
             # Look for SCSI address association (multiple formats)
             if current_slot is not None:
                 # Format 1: "SCSI address: H:C:T:L"
-                match = re.search(r'SCSI address:\s*(\d+):(\d+):(\d+):(\d+)', line, re.IGNORECASE)
+                match = _SES_SCSI_ADDR_RE.search(line)
                 if not match:
                     # Format 2: "[H:C:T:L]"
-                    match = re.search(r'\[(\d+):(\d+):(\d+):(\d+)\]', line)
+                    match = _SCSI_ADDR_RE.search(line)
                 
                 if match:
                     scsi_addr = f"{match.group(1)}:{match.group(2)}:{match.group(3)}:{match.group(4)}"
                     enclosure['slots'][scsi_addr] = current_slot
-                    debug_print(f"    Bay/Slot {current_slot} -> SCSI {scsi_addr}")
+                    log.debug("    Bay/Slot %s -> SCSI %s", current_slot, scsi_addr)
                     slots_found += 1
                     current_slot = None
         
         if slots_found == 0:
-            debug_print(f"  ⚠ No slot mappings found in SES output")
-            debug_print(f"  This enclosure may not support slot->SCSI mapping via SES")
+            log.debug("  ⚠ No slot mappings found in SES output")
+            log.debug("  This enclosure may not support slot->SCSI mapping via SES")
         else:
-            debug_print(f"  ✓ Mapped {slots_found} drive slots")
+            log.debug("  ✓ Mapped %s drive slots", slots_found)
     
     @staticmethod
     def locate_drive_on(device_path):
@@ -290,12 +669,12 @@ class OSDMonitor:
         # Try ledctl first (simpler)
         result = run_command(["ledctl", f"locate={device_path}"], silent=True)
         if result is not None:
-            debug_print(f"LED ON for {device_path} via ledctl")
+            log.debug("LED ON for %s via ledctl", device_path)
             return True
         
         # Fall back to sg_ses if ledctl not available
         # This requires knowing the enclosure and slot - more complex
-        debug_print(f"ledctl not available for {device_path}, would need sg_ses with slot info")
+        log.debug("ledctl not available for %s, would need sg_ses with slot info", device_path)
         return False
     
     @staticmethod
@@ -312,10 +691,10 @@ class OSDMonitor:
         # Try ledctl first
         result = run_command(["ledctl", f"locate_off={device_path}"], silent=True)
         if result is not None:
-            debug_print(f"LED OFF for {device_path} via ledctl")
+            log.debug("LED OFF for %s via ledctl", device_path)
             return True
         
-        debug_print(f"ledctl not available for {device_path}")
+        log.debug("ledctl not available for %s", device_path)
         return False
     
     @staticmethod
@@ -338,40 +717,32 @@ class OSDMonitor:
     @staticmethod
     def extract_smart_details(smart_info):
         """Extract key SMART attributes from smartctl JSON output."""
-        details = {
-            'temperature': None,
-            'power_on_hours': None,
-            'reallocated_sectors': None,
-            'pending_sectors': None,
-            'uncorrectable': None,
-            'load_cycle_count': None,
-        }
+        details = SmartDetails()
         
         if 'temperature' in smart_info:
-            details['temperature'] = smart_info['temperature'].get('current')
+            details.temperature = smart_info['temperature'].get('current')
         
         if 'ata_smart_attributes' in smart_info and 'table' in smart_info['ata_smart_attributes']:
+            attr_keys = OSDMonitor._SMART_ATTR_KEYS
+            found = set()
             for attr in smart_info['ata_smart_attributes']['table']:
-                attr_id = attr.get('id')
-                raw_value = attr.get('raw', {}).get('value', 0)
-                
-                if attr_id == 5:
-                    details['reallocated_sectors'] = raw_value
-                elif attr_id == 9:
-                    details['power_on_hours'] = raw_value
-                elif attr_id == 193:
-                    details['load_cycle_count'] = raw_value
-                elif attr_id == 197:
-                    details['pending_sectors'] = raw_value
-                elif attr_id == 198:
-                    details['uncorrectable'] = raw_value
+                key = attr_keys.get(attr.get('id'))
+                if key:
+                    setattr(details, key, attr.get('raw', {}).get('value', 0))
+                    found.add(key)
+                    # Stop once every attribute we care about has been seen
+                    if len(found) == len(attr_keys):
+                        break
         
         if 'scsi_grown_defect_list' in smart_info:
-            details['reallocated_sectors'] = smart_info.get('scsi_grown_defect_list', 0)
+            details.reallocated_sectors = smart_info.get('scsi_grown_defect_list', 0)
         
         return details
     
+    # The formatters are pure and see a small set of values on every render,
+    # so memoize them
     @staticmethod
+    @lru_cache(maxsize=512)
     def format_size_bytes(size_bytes):
         """Convert bytes to human-readable format."""
         if not size_bytes:
@@ -382,12 +753,10 @@ class OSDMonitor:
         except (ValueError, TypeError):
             return None
         
-        if size_bytes >= 1e12:
-            return f"{size_bytes / 1e12:.1f}T"
-        elif size_bytes >= 1e9:
-            return f"{size_bytes / 1e9:.0f}G"
-        else:
-            return f"{size_bytes / 1e6:.0f}M"
+        for divisor, suffix, decimals in OSDMonitor._SIZE_UNITS:
+            if size_bytes >= divisor:
+                break
+        return f"{size_bytes / divisor:.{decimals}f}{suffix}"
     
     def scan_jbod_enclosure(self, controller, seen_serials):
         """
@@ -404,315 +773,398 @@ class OSDMonitor:
         controller_type = controller['type']
         controller_index = controller['index']
         
-        debug_print(f"JBOD {controller_dev}: Starting enclosure scan...")
+        log.debug("JBOD %s: Starting enclosure scan...", controller_dev)
         
         # Get all SCSI devices from lsscsi
-        lsscsi_output = run_command(["lsscsi", "-g"], is_json=False, silent=True)
-        if not lsscsi_output:
-            debug_print(f"JBOD {controller_dev}: lsscsi command failed")
+        lsscsi_lines = self._get_lsscsi_lines()
+        if not lsscsi_lines:
+            log.debug("JBOD %s: lsscsi command failed", controller_dev)
             return drives
         
-        debug_print(f"JBOD {controller_dev}: Full lsscsi output:")
-        for line in lsscsi_output.splitlines():
-            debug_print(f"  lsscsi: {line}")
+        log.debug("JBOD %s: Full lsscsi output:", controller_dev)
         
-        # Parse lsscsi output to find all disk devices
+        # Parse lsscsi output to find all disk devices in a single pass
         # Format: [H:C:T:L]  disk  Vendor  Model  Rev  /dev/sdX  /dev/sgY
         # Note: /dev/sgY is optional (depends on -g flag)
         disk_devices = []
-        for line in lsscsi_output.splitlines():
-            # Look for disk entries
-            if 'disk' in line.lower():
-                # Try with sg device first
-                match = re.match(r'\[(\d+):(\d+):(\d+):(\d+)\]\s+disk\s+(\S+)\s+(\S+)\s+(\S+)\s+(/dev/sd\w+)\s+(/dev/sg\d+)', line)
-                sg_dev = None
-                if match:
-                    sg_dev = match.group(9)
-                else:
-                    # Try without sg device
-                    match = re.match(r'\[(\d+):(\d+):(\d+):(\d+)\]\s+disk\s+(\S+)\s+(\S+)\s+(\S+)\s+(/dev/sd\w+)', line)
+        probes = []
+        with self._thread_pool(len(lsscsi_lines)) as executor:
+            for line in lsscsi_lines:
+                log.debug("  lsscsi: %s", line)
                 
-                if match:
-                    host = int(match.group(1))
-                    channel = int(match.group(2))
-                    target = int(match.group(3))
-                    lun = int(match.group(4))
-                    vendor = match.group(5)
-                    model = match.group(6)
-                    dev_path = match.group(8)
+                # Look for disk entries
+                if 'disk' in line.lower():
+                    match = _LSSCSI_DISK_RE.match(line)
                     
-                    scsi_addr = f"{host}:{channel}:{target}:{lun}"
-                    disk_devices.append({
-                        'scsi_addr': scsi_addr,
-                        'host': host,
-                        'channel': channel,
-                        'target': target,
-                        'lun': lun,
-                        'vendor': vendor,
-                        'model': model,
-                        'dev_path': dev_path,
-                        'sg_dev': sg_dev
-                    })
-        
-        debug_print(f"JBOD {controller_dev}: Found {len(disk_devices)} total disk devices in system")
-        
-        # For JBOD, we can't easily determine which disks belong to which enclosure
-        # without additional enclosure services queries. For now, let's try to
-        # identify disks by looking for ones that don't respond to megaraid commands
-        # and match the vendor/model patterns typical of JBOD drives.
+                    if match:
+                        sg_dev = match.group(9)
+                        host = int(match.group(1))
+                        channel = int(match.group(2))
+                        target = int(match.group(3))
+                        lun = int(match.group(4))
+                        vendor = match.group(5)
+                        model = match.group(6)
+                        dev_path = match.group(8)
+                        
+                        scsi_addr = f"{host}:{channel}:{target}:{lun}"
+                        disk_devices.append({
+                            'scsi_addr': scsi_addr,
+                            'host': host,
+                            'channel': channel,
+                            'target': target,
+                            'lun': lun,
+                            'vendor': vendor,
+                            'model': model,
+                            'dev_path': dev_path,
+                            'sg_dev': sg_dev
+                        })
+                        # Query the disk directly (not via megaraid) while
+                        # the remaining lines are still being parsed
+                        probes.append(executor.submit(
+                            run_command, ["smartctl", "-j", "-i", "-A", "-H", dev_path], is_json=True, silent=True
+                        ))
+            
+            log.debug("JBOD %s: Found %s total disk devices in system", controller_dev, len(disk_devices))
+            
+            # For JBOD, we can't easily determine which disks belong to which enclosure
+            # without additional enclosure services queries. For now, let's try to
+            # identify disks by looking for ones that don't respond to megaraid commands
+            # and match the vendor/model patterns typical of JBOD drives.
+            
+            # Results are still processed in lsscsi order
+            infos = [probe.result() for probe in probes]
         
         jbod_candidate_count = 0
-        for disk in disk_devices:
+        for disk, info in zip(disk_devices, infos):
             dev_path = disk['dev_path']
             sg_dev = disk.get('sg_dev', 'N/A')
             
-            # Try to query the device directly using the block device (not via megaraid)
-            debug_print(f"JBOD scan: Checking {dev_path} ({disk['scsi_addr']}) sg={sg_dev}")
-            
-            info = run_command(["smartctl", "-j", "-a", dev_path], is_json=True, silent=True)
+            log.debug("JBOD scan: Checking %s (%s) sg=%s", dev_path, disk['scsi_addr'], sg_dev)
             
             if info and 'serial_number' in info:
                 serial = info['serial_number']
                 
                 # Skip duplicates
                 if serial in seen_serials:
-                    debug_print(f"  {dev_path}: Serial {serial} already seen, skipping")
+                    log.debug("  %s: Serial %s already seen, skipping", dev_path, serial)
                     continue
                 
                 # Check if this looks like a direct-attached JBOD drive
                 # JBOD drives typically show up with vendor/model info
-                model = info.get('model_name', info.get('model_family', 'Unknown'))
-                vendor = info.get('vendor', disk['vendor'])
+                get = info.get
+                model = get('model_name', get('model_family', 'Unknown'))
+                vendor = get('vendor', disk['vendor'])
                 
                 # Skip if this is a MegaRAID virtual drive or controller device
                 if 'megaraid' in model.lower() or 'perc' in model.lower():
-                    debug_print(f"  {dev_path}: Skipping MegaRAID/PERC virtual device")
+                    log.debug("  %s: Skipping MegaRAID/PERC virtual device", dev_path)
                     continue
                 
                 if not vendor and model:
-                    vendor_match = re.match(r'^(\w+)', model)
-                    if vendor_match:
-                        vendor = vendor_match.group(1)
+                    vendor = _leading_word(model)
                 
-                health_passed = info.get('smart_status', {}).get('passed', False)
+                health_passed = get('smart_status', {}).get('passed', False)
                 smart_details = self.extract_smart_details(info)
                 
-                size = None
-                if 'user_capacity' in info:
-                    size_info = info['user_capacity']
-                    if isinstance(size_info, dict) and 'bytes' in size_info:
-                        size = self.format_size_bytes(size_info['bytes'])
+                capacity = get('user_capacity')
+                size = self.format_size_bytes(capacity.get('bytes')) if isinstance(capacity, dict) else None
                 
                 seen_serials.add(serial)
                 jbod_candidate_count += 1
                 
-                drives[serial] = {
-                    'phy_id': disk['target'],  # Use target ID as PHY
-                    'serial': serial,
-                    'model': model,
-                    'vendor': vendor,
-                    'health_hw': 'OK' if health_passed else 'FAIL',
-                    'smart_details': smart_details,
-                    'current_device': None,
-                    'scsi_address': disk['scsi_addr'],
-                    'size': size,
-                    'controller': controller_type,
-                    'controller_device': controller_dev,
-                }
+                drives[serial] = Drive(
+                    phy_id=disk['target'],  # Use target ID as PHY
+                    serial=serial,
+                    model=model,
+                    vendor=vendor,
+                    health_hw='OK' if health_passed else 'FAIL',
+                    smart_details=smart_details,
+                    current_device=None,
+                    scsi_address=disk['scsi_addr'],
+                    size=size,
+                    controller=controller_type,
+                    controller_device=controller_dev,
+                )
                 
-                debug_print(f"  ✓ {dev_path} PHY {disk['target']}: {model} S/N:{serial} SCSI:{disk['scsi_addr']} Size:{size or 'N/A'}")
+                log.debug("  ✓ %s PHY %s: %s S/N:%s SCSI:%s Size:%s", dev_path, disk['target'], model, serial, disk['scsi_addr'], size or 'N/A')
             else:
-                debug_print(f"  {dev_path}: No SMART data available")
+                log.debug("  %s: No SMART data available", dev_path)
         
-        debug_print(f"JBOD {controller_dev}: Found {len(drives)} drives (from {jbod_candidate_count} candidates)")
+        log.debug("JBOD %s: Found %s drives (from %s candidates)", controller_dev, len(drives), jbod_candidate_count)
         return drives
     
-    def scan_physical_drives(self, progress_callback=None):
+    def _drive_from_probe(self, controller, phy_id, info):
+        """
+        Build the Drive for one MegaRAID PHY slot from its _probe_drive() output.
+        
+        Returns:
+            tuple: (serial, Drive), or None if the slot is empty
+        """
+        controller_dev = controller['device']
+        
+        if not info or 'serial_number' not in info:
+            return None
+        
+        get = info.get
+        serial = info['serial_number']
+        model = get('model_name', get('model_family', 'Unknown'))
+        vendor = get('vendor', '')
+
+        if not vendor and model:
+            vendor = _leading_word(model)
+
+        health_passed = get('smart_status', {}).get('passed', False)
+        smart_details = self.extract_smart_details(info)
+        
+        capacity = get('user_capacity')
+        size = self.format_size_bytes(capacity.get('bytes')) if isinstance(capacity, dict) else None
+        
+        scsi_address = self.build_scsi_address_from_phy(phy_id, controller['index'])
+
+        return serial, Drive(
+            phy_id=phy_id,
+            serial=serial,
+            model=model,
+            vendor=vendor,
+            health_hw='OK' if health_passed else 'FAIL',
+            smart_details=smart_details,
+            current_device=None,
+            scsi_address=scsi_address,
+            size=size,
+            controller=controller['type'],
+            controller_device=controller_dev,
+        )
+    
+    def _enumerate_populated_phys(self):
+        """
+        List the MegaRAID PHY ids that actually hold a drive.
+        
+        One `smartctl --scan -d megaraid` replaces probing every empty slot.
+        It reports drives per SCSI bus rather than per sg device, so the ids
+        are merged across controllers (a superset when there are several).
+        Falls back to all 32 slots if the scan fails or finds nothing.
+        
+        Returns:
+            list: sorted PHY ids, cached until the next scan()
+        """
+        if self._phy_cache is not None:
+            return self._phy_cache
+        
+        phy_ids = set()
+        scan = run_command(["smartctl", "--scan", "-d", "megaraid", "-j"], is_json=True, silent=True)
+        if scan:
+            for dev in scan.get('devices', []):
+                dev_type, _, phy = dev.get('type', '').partition(',')
+                if dev_type == 'megaraid' and phy.isdigit():
+                    phy_ids.add(int(phy))
+        
+        if phy_ids:
+            log.debug("smartctl --scan found %s populated MegaRAID PHY(s)", len(phy_ids))
+            self._phy_cache = sorted(phy_ids)
+        else:
+            log.debug("smartctl --scan found no MegaRAID drives, probing all 32 PHYs")
+            self._phy_cache = list(range(32))
+        return self._phy_cache
+    
+    def scan_physical_drives(self, progress_callback=None, parallel=False):
         """
         Scan ALL RAID controllers for physical drives.
         
+        MegaRAID slot probes are I/O-bound smartctl calls, so they all run
+        concurrently in a thread pool and are collected controller by controller.
+        
         Args:
             progress_callback: Optional function(current, total, message) for progress updates
+            parallel: Use a process pool instead of threads for the slot probes;
+                the workers re-import the main script, so it needs an
+                `if __name__ == "__main__":` guard
         
         Returns:
-            dict: {serial: {phy_id, serial, model, vendor, health_hw, smart_details, size, scsi_address, controller}}
+            dict: {serial: Drive}
         """
         drives = {}
-        slots_per_controller = 32
-        total_slots = len(self.controllers) * slots_per_controller
+        phy_ids = self._enumerate_populated_phys()
+        total_slots = len(self.controllers) * len(phy_ids)
         current_slot = 0
         
         # Track which serials we've seen to avoid duplicates
         seen_serials = set()
         
-        for controller in self.controllers:
-            controller_dev = controller['device']
-            controller_type = controller['type']
-            controller_index = controller['index']
-            is_megaraid = controller.get('is_megaraid', True)
-            
-            debug_print(f"Scanning controller {controller_dev} ({controller_type})")
-            
-            # JBOD/Direct enclosures - scan all lsscsi disks not from MegaRAID
-            if not is_megaraid:
-                jbod_drives = self.scan_jbod_enclosure(controller, seen_serials)
-                drives.update(jbod_drives)
-                continue
+        megaraid_count = sum(1 for c in self.controllers if c.get('is_megaraid', True))
+        if parallel:
+            # Forking while the scan pool's threads run can copy a held lock
+            # into the child, so start workers from a clean forkserver instead
+            pool = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                       mp_context=multiprocessing.get_context('forkserver'))
+        else:
+            pool = self._thread_pool(megaraid_count * len(phy_ids))
+        
+        with pool as executor:
+            # Start every MegaRAID slot probe up front; results are still
+            # consumed in controller/PHY order so duplicate handling is deterministic
+            pending = [
+                {executor.submit(_probe_drive, (controller['device'], phy_id)): phy_id for phy_id in phy_ids}
+                if controller.get('is_megaraid', True) else None
+                for controller in self.controllers
+            ]
             
-            # For MegaRAID controllers, use the megaraid passthrough
-            for phy_id in range(slots_per_controller):
-                if progress_callback:
-                    progress_callback(current_slot, total_slots, 
-                                    f"Scanning {controller_dev} PHY {phy_id}")
-                current_slot += 1
+            for controller, futures in zip(self.controllers, pending):
+                controller_dev = controller['device']
+                controller_type = controller['type']
                 
-                info = run_command(
-                    ["smartctl", "-j", "-a", "-d", f"megaraid,{phy_id}", controller_dev],
-                    is_json=True, 
-                    silent=True
-                )
-
-                if info and 'serial_number' in info:
-                    serial = info['serial_number']
+                log.debug("Scanning controller %s (%s)", controller_dev, controller_type)
+                
+                # JBOD/Direct enclosures - scan all lsscsi disks not from MegaRAID
+                if futures is None:
+                    jbod_drives = self.scan_jbod_enclosure(controller, seen_serials)
+                    drives.update(jbod_drives)
+                    continue
+                
+                # For MegaRAID controllers, use the megaraid passthrough.
+                # Progress follows the probes as they actually finish...
+                for future in as_completed(futures):
+                    if progress_callback:
+                        progress_callback(current_slot, total_slots, 
+                                        f"Scanned {controller_dev} PHY {futures[future]}")
+                    current_slot += 1
+                
+                # ...while results are taken in PHY order
+                for future, phy_id in futures.items():
+                    result = self._drive_from_probe(controller, phy_id, future.result())
+                    if not result:
+                        continue
+                    
+                    serial, drive = result
                     
                     # Skip if we've already seen this serial number
                     # (multiple sg devices may be passthrough to same controller)
                     if serial in seen_serials:
-                        debug_print(f"Controller {controller_dev} PHY {phy_id}: Duplicate serial {serial} (already found on another controller passthrough)")
+                        log.debug("Controller %s PHY %s: Duplicate serial %s (already found on another controller passthrough)", controller_dev, phy_id, serial)
                         continue
                     
                     seen_serials.add(serial)
-                    
-                    model = info.get('model_name', info.get('model_family', 'Unknown'))
-                    vendor = info.get('vendor', '')
-
-                    if not vendor and model:
-                        vendor_match = re.match(r'^(\w+)', model)
-                        if vendor_match:
-                            vendor = vendor_match.group(1)
-
-                    health_passed = info.get('smart_status', {}).get('passed', False)
-                    smart_details = self.extract_smart_details(info)
-                    
-                    size = None
-                    if 'user_capacity' in info:
-                        size_info = info['user_capacity']
-                        if isinstance(size_info, dict) and 'bytes' in size_info:
-                            size = self.format_size_bytes(size_info['bytes'])
-                    
-                    scsi_address = self.build_scsi_address_from_phy(phy_id, controller_index)
-
-                    drives[serial] = {
-                        'phy_id': phy_id,
-                        'serial': serial,
-                        'model': model,
-                        'vendor': vendor,
-                        'health_hw': 'OK' if health_passed else 'FAIL',
-                        'smart_details': smart_details,
-                        'current_device': None,
-                        'scsi_address': scsi_address,
-                        'size': size,
-                        'controller': controller_type,
-                        'controller_device': controller_dev,
-                    }
+                    drives[serial] = drive
 
-                    debug_print(f"Controller {controller_dev} PHY {phy_id}: {model} S/N:{serial} SCSI:{scsi_address} Size:{size or 'N/A'}")
+                    log.debug("Controller %s PHY %s: %s S/N:%s SCSI:%s Size:%s", controller_dev, phy_id, drive.model, serial, drive.scsi_address, drive.size or 'N/A')
         
         if progress_callback:
             progress_callback(total_slots, total_slots, "Scan complete")
         
-        debug_print(f"Found {len(drives)} unique physical drives across {len(self.controllers)} controller(s)")
+        log.debug("Found %s unique physical drives across %s controller(s)", len(drives), len(self.controllers))
         return drives
     
     def map_drives_to_devices(self, drives):
         """Map physical drives to current /dev/sdX device names."""
-        lsscsi_output = run_command(["lsscsi"], is_json=False, silent=True)
+        # The trailing /dev/sgN column from -g doesn't affect the match
+        lsscsi_lines = self._get_lsscsi_lines()
 
-        if lsscsi_output:
-            for line in lsscsi_output.splitlines():
-                match = re.match(r'\[([^\]]+)\]\s+(\w+)\s+(\S+)\s+(\S+)\s+\S+\s+(/dev/\w+)', line)
-                if match:
-                    scsi_addr = match.group(1)
-                    dev_type = match.group(2)
-                    vendor = match.group(3)
-                    model = match.group(4)
-                    dev_path = match.group(5)
-                    dev_name = dev_path.replace('/dev/', '')
+        if lsscsi_lines:
+            # One lsblk call gives the serial and size of every disk
+            block_devices = {}
+            lsblk_info = run_command(["lsblk", "-J", "-d", "-o", "NAME,SERIAL,SIZE"], is_json=True, silent=True)
+            if lsblk_info:
+                for dev in lsblk_info.get('blockdevices', []):
+                    block_devices[dev.get('name')] = dev
 
-                    if dev_type != 'disk':
+            # Trust lsblk when its serial is one we know; otherwise ask
+            # smartctl, as udev's serial can differ from the drive's own.
+            # Each fallback starts as soon as its lsscsi line is parsed and
+            # they run concurrently; results keep lsscsi order
+            disk_entries = []
+            with self._thread_pool(len(lsscsi_lines)) as executor:
+                for line in lsscsi_lines:
+                    match = _LSSCSI_FULL_RE.match(line)
+                    if not match or match.group(2) != 'disk':
                         continue
+                    dev_path = match.group(5)
+                    serial = block_devices.get(dev_path.replace('/dev/', ''), {}).get('serial')
+                    probe = None
+                    if serial not in drives:
+                        probe = executor.submit(run_command, ["smartctl", "-j", "-i", dev_path], is_json=True, silent=True)
+                    disk_entries.append((match.groups(), serial, probe))
 
-                    info = run_command(["smartctl", "-j", "-i", dev_path], is_json=True, silent=True)
-                    if info and 'serial_number' in info:
-                        serial = info['serial_number']
+            for (scsi_addr, dev_type, vendor, model, dev_path), serial, probe in disk_entries:
+                if probe:
+                    info = probe.result()
+                    serial = info.get('serial_number') if info else None
+                dev_name = dev_path.replace('/dev/', '')
 
-                        if serial in drives:
-                            drives[serial]['current_device'] = dev_name
-                            drives[serial]['scsi_address'] = scsi_addr
+                drive = drives.get(serial)
+                if drive:
+                    drive.current_device = dev_name
+                    drive.scsi_address = scsi_addr
 
-                            if vendor and model:
-                                drives[serial]['model'] = f"{vendor} {model}"
+                    if vendor and model:
+                        drive.model = f"{vendor} {model}"
 
-                            lsblk_info = run_command(
-                                ["lsblk", "-J", "-o", "NAME,SIZE", dev_path],
-                                is_json=True, 
-                                silent=True
-                            )
-                            if lsblk_info and 'blockdevices' in lsblk_info:
-                                lsblk_size = lsblk_info['blockdevices'][0].get('size', None)
-                                if lsblk_size:
-                                    drives[serial]['size'] = lsblk_size
+                    # Fall back to lsblk's size when smartctl didn't report a capacity
+                    if not drive.size:
+                        lsblk_size = block_devices.get(dev_name, {}).get('size')
+                        if lsblk_size:
+                            drive.size = lsblk_size
 
-                            debug_print(f"{dev_name}: SCSI {scsi_addr}, Serial {serial}, "
-                                      f"PHY {drives[serial]['phy_id']}, Size {drives[serial]['size']}")
+                    log.debug("%s: SCSI %s, Serial %s, PHY %s, Size %s",
+                              dev_name, scsi_addr, serial, drive.phy_id, drive.size)
 
-        mapped = sum(1 for d in drives.values() if d.get('current_device'))
+        mapped = sum(1 for d in drives.values() if d.current_device)
         unmapped = len(drives) - mapped
-        debug_print(f"Mapped {mapped}/{len(drives)} physical drives to device names")
+        log.debug("Mapped %s/%s physical drives to device names", mapped, len(drives))
         if unmapped > 0:
-            debug_print(f"{unmapped} drive(s) not visible to OS")
+            log.debug("%s drive(s) not visible to OS", unmapped)
         
         return drives
     
-    def get_ceph_osds(self):
-        """Get ALL Ceph OSDs metadata."""
-        metadata = run_command(["ceph", "osd", "metadata"], is_json=True)
+    def _fetch_ceph_report(self):
+        """
+        `ceph report` as JSON: OSD metadata and the OSD map (up/in) in a
+        single MON round-trip.
+        """
+        return run_command(["ceph", "report", "-f", "json"], is_json=True, silent=True, timeout=self.CEPH_TIMEOUT)
+    
+    def get_ceph_osds(self, report=None):
+        """Get ALL Ceph OSDs metadata, taken from `ceph report` output if given."""
+        if report and 'osd_metadata' in report:
+            metadata = report['osd_metadata']
+        else:
+            metadata = run_command(["ceph", "osd", "metadata"], is_json=True, timeout=self.CEPH_TIMEOUT)
         if not metadata:
-            debug_print("ERROR: Could not retrieve Ceph OSD metadata!")
+            log.debug("ERROR: Could not retrieve Ceph OSD metadata!")
             return {}
 
         osds = {}
         for osd in metadata:
             osd_id = str(osd.get('id', ''))
             osds[osd_id] = osd
-            debug_print(f"OSD {osd_id}: host={osd.get('hostname', 'unknown')} "
-                       f"device_ids={osd.get('device_ids', 'N/A')}")
+            log.debug("OSD %s: host=%s device_ids=%s",
+                      osd_id, osd.get('hostname', 'unknown'), osd.get('device_ids', 'N/A'))
 
-        debug_print(f"Found {len(osds)} OSDs in cluster")
+        log.debug("Found %s OSDs in cluster", len(osds))
         return osds
     
     def get_osd_performance(self):
         """Get OSD performance metrics (latency)."""
+        # `ceph report` has no per-OSD perf stats on Luminous and later, so
+        # this is always its own query
         perf = {}
-        output = run_command(["ceph", "osd", "perf"], is_json=False, silent=True)
+        
+        output = run_command(["ceph", "osd", "perf"], is_json=False, silent=True, timeout=self.CEPH_TIMEOUT)
         
         if output:
             for line in output.splitlines():
-                if 'osd' in line and 'commit_latency' in line:
-                    continue
-                
-                match = re.match(r'\s*(\d+)\s+(\d+)\s+(\d+)', line)
-                if match:
-                    osd_id = match.group(1)
-                    commit_lat = int(match.group(2))
-                    apply_lat = int(match.group(3))
+                # Fixed columns: "osd  commit_latency(ms)  apply_latency(ms)";
+                # the header row fails the isdigit() checks
+                parts = line.split()
+                if len(parts) >= 3 and parts[0].isdigit() and parts[1].isdigit() and parts[2].isdigit():
+                    osd_id = parts[0]
+                    commit_lat = int(parts[1])
+                    apply_lat = int(parts[2])
                     perf[osd_id] = {
                         'commit_latency_ms': commit_lat,
                         'apply_latency_ms': apply_lat
                     }
-                    debug_print(f"OSD {osd_id}: commit={commit_lat}ms, apply={apply_lat}ms")
+                    log.debug("OSD %s: commit=%sms, apply=%sms", osd_id, commit_lat, apply_lat)
         
-        debug_print(f"Got performance data for {len(perf)} OSDs")
+        log.debug("Got performance data for %s OSDs", len(perf))
         return perf
     
     @staticmethod
@@ -729,12 +1181,10 @@ class OSDMonitor:
             device_name = device_name.strip()
             identifier = identifier.strip()
 
-            parts = identifier.split('_')
-            if len(parts) >= 3:
-                vendor = parts[0]
-                serial = parts[-1]
-                model = '_'.join(parts[1:-1])
-
+            # VENDOR_MODEL_SERIAL - model itself may contain underscores
+            vendor, sep, rest = identifier.partition('_')
+            model, sep2, serial = rest.rpartition('_')
+            if sep and sep2:
                 return {
                     'device_name': device_name,
                     'vendor': vendor,
@@ -755,69 +1205,102 @@ class OSDMonitor:
 
             parsed = self.parse_device_id(device_ids)
             if not parsed:
-                debug_print(f"OSD {osd_id}: Could not parse device_ids: {device_ids}")
+                log.debug("OSD %s: Could not parse device_ids: %s", osd_id, device_ids)
                 continue
 
             osd_serial = parsed['serial']
 
             if osd_serial in drives:
                 osd_to_drive[osd_id] = osd_serial
-                debug_print(f"âœ“ OSD {osd_id} (on {hostname}): Matched to local drive")
-                debug_print(f"  Serial: {osd_serial}, PHY: {drives[osd_serial]['phy_id']}, "
-                           f"Device: {drives[osd_serial].get('current_device', 'N/A')}")
+                log.debug("âœ“ OSD %s (on %s): Matched to local drive", osd_id, hostname)
+                log.debug("  Serial: %s, PHY: %s, Device: %s",
+                          osd_serial, drives[osd_serial].phy_id, drives[osd_serial].current_device or 'N/A')
             else:
-                debug_print(f"OSD {osd_id} (on {hostname}): Serial {osd_serial} not found locally")
+                log.debug("OSD %s (on %s): Serial %s not found locally", osd_id, hostname, osd_serial)
 
-        debug_print(f"Matched {len(osd_to_drive)} OSDs to local drives")
+        log.debug("Matched %s OSDs to local drives", len(osd_to_drive))
         return osd_to_drive
     
-    def get_osd_status(self):
-        """Get OSD status information: up/down and in/out."""
+    def _fetch_osd_tree(self):
+        """`ceph osd tree` as JSON (up/down state, and in/out via reweight)."""
+        return run_command(["ceph", "osd", "tree", "-f", "json"], is_json=True, timeout=self.CEPH_TIMEOUT)
+    
+    def _fetch_osd_dump(self):
+        """`ceph osd dump` as JSON (authoritative in/out state, fallback only)."""
+        return run_command(["ceph", "osd", "dump", "-f", "json"], is_json=True, timeout=self.CEPH_TIMEOUT)
+    
+    def get_osd_status(self, report=None):
+        """Get OSD status information: up/down and in/out, from `ceph report` output if given."""
+        # The report's osdmap is the same data as `ceph osd dump`
+        if report and report.get('osdmap'):
+            return self._parse_osd_status(None, report['osdmap'])
+        return self._osd_status_from_tree(self._fetch_osd_tree())
+    
+    def _osd_status_from_tree(self, tree):
+        """
+        Build the OSD status map from `ceph osd tree` alone when possible.
+        
+        `ceph osd dump` is only fetched when the tree is unavailable or
+        leaves an OSD's in/out state unknown.
+        """
+        status_map = self._parse_osd_status(tree)
+        if not status_map or any(status['in'] is None for status in status_map.values()):
+            log.debug("osd tree lacks in/out state, falling back to osd dump")
+            status_map = self._parse_osd_status(tree, self._fetch_osd_dump())
+        return status_map
+    
+    def _parse_osd_status(self, tree, dump=None):
+        """Build {osd_id: {'up': bool, 'in': bool}} from the tree (and optional dump) JSON."""
         status_map = {}
 
-        tree_output = run_command(["ceph", "osd", "tree"], is_json=False)
-        if tree_output:
-            for line in tree_output.splitlines():
-                match = re.match(r'\s*(\d+)\s+\w+\s+[\d\.]+\s+osd\.\d+\s+(\w+)\s+.*', line)
-                if match:
-                    osd_id = match.group(1)
-                    up_status = match.group(2)
-                    status_map[osd_id] = {
-                        'up': (up_status == 'up'),
-                        'in': None
+        if tree:
+            for node in tree.get('nodes', []):
+                # exists=0 marks destroyed/purged OSD ids that linger in the tree
+                if node.get('type') == 'osd' and node.get('exists', 1):
+                    # An OSD marked out has its reweight set to 0, so the tree
+                    # also tells us in/out
+                    reweight = node.get('reweight')
+                    status_map[str(node['id'])] = {
+                        'up': (node.get('status') == 'up'),
+                        'in': (reweight > 0) if reweight is not None else None
                     }
 
-        dump_output = run_command(["ceph", "osd", "dump"], is_json=False)
-        if dump_output:
-            for line in dump_output.splitlines():
-                match = re.search(r'osd\.(\d+)\s+(\w+)\s+(\w+)', line)
-                if match:
-                    osd_id = match.group(1)
-                    in_status = match.group(3)
-                    if osd_id in status_map:
-                        status_map[osd_id]['in'] = (in_status == 'in')
+        if dump:
+            # The dump also covers OSDs missing from the tree (e.g. not yet in
+            # the CRUSH map), so take up/down from it for those
+            for osd in dump.get('osds', []):
+                status = status_map.setdefault(str(osd.get('osd')), {'up': bool(osd.get('up'))})
+                status['in'] = bool(osd.get('in'))
 
-        debug_print(f"Got status for {len(status_map)} OSDs")
+        log.debug("Got status for %s OSDs", len(status_map))
         return status_map
     
     def check_systemd_status(self, osd_ids):
         """Check systemd service status for OSDs."""
         systemd_status = {}
+        osd_ids = list(osd_ids)
+        if not osd_ids:
+            return systemd_status
+
+        # One call for all units: systemctl prints one state per unit, in
+        # argument order, and exits non-zero if any unit is not active
+        units = [f"ceph-osd@{osd_id}.service" for osd_id in osd_ids]
+        result = run_command(["systemctl", "is-active", "--"] + units,
+                           is_json=False, silent=True, check=False)
+        states = result.splitlines() if result else []
 
-        for osd_id in osd_ids:
-            service_name = f"ceph-osd@{osd_id}.service"
-            result = run_command(["systemctl", "is-active", service_name],
-                               is_json=False, silent=True)
+        for i, osd_id in enumerate(osd_ids):
+            state = states[i].strip() if i < len(states) else ''
 
-            if result and result.strip() in ['active', 'activating']:
+            if state in ['active', 'activating']:
                 systemd_status[osd_id] = 'active'
-                debug_print(f"OSD {osd_id} systemd: active")
-            elif result and result.strip() in ['inactive', 'failed', 'deactivating']:
+                log.debug("OSD %s systemd: active", osd_id)
+            elif state in ['inactive', 'failed', 'deactivating']:
                 systemd_status[osd_id] = 'inactive'
-                debug_print(f"OSD {osd_id} systemd: inactive ({result.strip()})")
+                log.debug("OSD %s systemd: inactive (%s)", osd_id, state)
             else:
                 systemd_status[osd_id] = 'unknown'
-                debug_print(f"OSD {osd_id} systemd: unknown")
+                log.debug("OSD %s systemd: unknown", osd_id)
 
         return systemd_status
     
@@ -830,7 +1313,7 @@ class OSDMonitor:
             return
         
         for serial, drive in self.drives.items():
-            scsi_addr = drive.get('scsi_address')
+            scsi_addr = drive.scsi_address
             if not scsi_addr:
                 continue
             
@@ -843,55 +1326,188 @@ class OSDMonitor:
                 
                 # Look up the physical slot/bay for this SCSI address
                 if scsi_addr in enclosure['slots']:
-                    drive['enclosure_slot'] = enclosure['slots'][scsi_addr]
-                    drive['enclosure_name'] = enclosure['name']
-                    drive['enclosure_device'] = enclosure['device']
-                    debug_print(f"Drive {serial}: Physical bay/slot {drive['enclosure_slot']} in {enclosure['name']}")
+                    drive.enclosure_slot = enclosure['slots'][scsi_addr]
+                    drive.enclosure_name = enclosure['name']
+                    drive.enclosure_device = enclosure['device']
+                    log.debug("Drive %s: Physical bay/slot %s in %s", serial, drive.enclosure_slot, enclosure['name'])
+    
+    def set_cache_ttl(self, ttl):
+        """Set how long (seconds) a scan() result is reused; 0 disables caching."""
+        self.cache_ttl = ttl
     
-    def scan(self, progress_callback=None):
+    def scan(self, progress_callback=None, parallel=False, force=False):
         """
         Complete scan of all drives and OSDs.
         
+        A successful result is reused for cache_ttl seconds, so frontends that
+        poll don't re-run every smartctl/ceph command on each refresh.
+        
         Args:
             progress_callback: Optional function(current, total, message) for progress updates
+            parallel: Probe drive slots concurrently (see scan_physical_drives)
+            force: Ignore any cached result and scan again
+        
+        Scans are serialised; a caller that had to wait for another scan to
+        finish shares that scan's result rather than starting a new one.
         
         Returns:
             dict: Complete scan data including drives, osds, status, performance
         """
-        self.scan_timestamp = datetime.now().isoformat()
-        
-        # Find all controllers
-        self.controllers = self.find_raid_controllers()
-        
-        # Find SES enclosures for bay mapping and LED control
-        self.enclosures = self.find_ses_enclosures()
+        count = self._scan_count
+        with self._scan_lock:
+            now = time.monotonic()
+            if self._cache is not None:
+                if self._scan_count != count:
+                    return self._cache
+                if not force and now - self._cache_ts < self.cache_ttl:
+                    return self._cache
+            
+            data = self._scan(progress_callback, parallel)
+            if data is not None:
+                self._cache = data
+                self._cache_ts = now
+                self._scan_count += 1
+            return data
+    
+    async def ascan(self, progress_callback=None, parallel=False, force=False):
+        """
+        scan() for asyncio callers (e.g. a web dashboard).
         
-        # Build controller info summary
-        self.controller_info = {
-            'count': len(self.controllers),
-            'controllers': self.controllers
+        The scan runs in a worker thread so the event loop keeps serving
+        while the subprocesses run; arguments and caching are as for scan().
+        """
+        return await asyncio.to_thread(self.scan, progress_callback, parallel, force)
+    
+    def _hardware_fingerprint(self):
+        """Cheap summary of the attached hardware: controllers, populated PHYs and visible disks."""
+        return {
+            'controllers': [[c['device'], c['model']] for c in self.controllers],
+            'phys': self._enumerate_populated_phys(),
+            'disks': [line for line in (self._get_lsscsi_lines() or []) if _LSSCSI_DISK_RE.match(line)],
         }
+    
+    def _load_inventory(self, fingerprint):
+        """
+        Load the drive inventory saved by a previous run.
         
-        # Scan physical drives from all controllers
-        self.drives = self.scan_physical_drives(progress_callback)
-        if not self.drives:
-            return None
-        
-        # Map to devices
-        self.drives = self.map_drives_to_devices(self.drives)
-        
-        # Add enclosure bay/slot info to drives
-        self._add_enclosure_info_to_drives()
-        
-        # Get Ceph data
-        self.osds = self.get_ceph_osds()
-        if not self.osds:
+        Returns:
+            dict: {'drives', 'enclosures'}, or None if missing, unreadable,
+            from another format version, older than inventory_ttl, or taken
+            with different hardware attached
+        """
+        try:
+            with open(self.INVENTORY_CACHE_FILE, 'rb') as f:
+                cache = _json_loads(f.read())
+            
+            if cache.get('version') != self.INVENTORY_VERSION:
+                return None
+            if time.time() - cache.get('ts', 0) >= self.inventory_ttl:
+                return None
+            if cache.get('fingerprint') != fingerprint:
+                log.debug("Hardware changed since the drive inventory was saved, rescanning")
+                return None
+            
+            # JSON turned the integer SCSI host keys into strings
+            return {
+                'drives': {serial: Drive.from_dict(d) for serial, d in cache['drives'].items()},
+                'enclosures': {int(host): encl for host, encl in cache['enclosures'].items()},
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            # A damaged or hand-edited file only costs a rescan
+            log.debug("Ignoring unreadable drive inventory: %s", e)
             return None
+    
+    def _save_inventory(self, fingerprint):
+        """Persist the drive inventory for the next run; failing only costs a rescan."""
+        cache = {
+            'version': self.INVENTORY_VERSION,
+            'ts': time.time(),
+            'fingerprint': fingerprint,
+            'drives': {serial: drive.to_dict() for serial, drive in self.drives.items()},
+            'enclosures': self.enclosures,
+        }
+        tmp_file = self.INVENTORY_CACHE_FILE.with_suffix('.tmp')
+        try:
+            self.INVENTORY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, self.INVENTORY_CACHE_FILE)
+        except (OSError, TypeError, ValueError) as e:
+            log.debug("Could not save drive inventory: %s", e)
+    
+    def _scan(self, progress_callback, parallel):
+        """Run every collection step of scan(), bypassing the cache."""
+        self.scan_timestamp = datetime.now().isoformat()
+        prime_sudo()
+        self._lsscsi_cache = None
+        self._phy_cache = None
+        self._pool = ThreadPoolExecutor(max_workers=self._MAX_WORKERS)
         
-        self.osd_perf = self.get_osd_performance()
-        self.osd_to_drive = self.match_drives_to_osds(self.drives, self.osds)
-        self.osd_status = self.get_osd_status()
-        self.systemd_status = self.check_systemd_status(self.osd_to_drive.keys())
+        try:
+            # The Ceph data doesn't depend on the hardware scan, so start its
+            # queries first and let them overlap the smartctl probes
+            report_future = self._pool.submit(self._fetch_ceph_report)
+            perf_future = self._pool.submit(self.get_osd_performance)
+            
+            # Find all controllers
+            self.controllers = self.find_raid_controllers()
+            
+            # Build controller info summary
+            self.controller_info = {
+                'count': len(self.controllers),
+                'controllers': self.controllers
+            }
+            
+            # Reuse the previous run's drive inventory if the hardware is unchanged
+            inventory = None
+            if self.inventory_ttl:
+                fingerprint = self._hardware_fingerprint()
+                inventory = self._load_inventory(fingerprint)
+            
+            if inventory:
+                log.debug("Hardware unchanged, reusing saved drive inventory")
+                self.enclosures = inventory['enclosures']
+                self.drives = inventory['drives']
+                if progress_callback:
+                    progress_callback(1, 1, "Reused saved drive inventory")
+            else:
+                # Find SES enclosures for bay mapping and LED control
+                self.enclosures = self.find_ses_enclosures()
+                
+                # Scan physical drives from all controllers
+                self.drives = self.scan_physical_drives(progress_callback, parallel=parallel)
+                if not self.drives:
+                    return None
+                
+                # Map to devices
+                self.drives = self.map_drives_to_devices(self.drives)
+                
+                # Add enclosure bay/slot info to drives
+                self._add_enclosure_info_to_drives()
+                
+                if self.inventory_ttl:
+                    self._save_inventory(fingerprint)
+            
+            self._lsscsi_cache = None  # hardware steps are done with it
+            
+            # Collect the Ceph data; without a report each part falls back
+            # to its own `ceph osd ...` command, so run them side by side
+            report = report_future.result()
+            status_future = self._pool.submit(self.get_osd_status, report)
+            self.osds = self.get_ceph_osds(report)
+            if not self.osds:
+                return None
+            
+            self.osd_perf = perf_future.result()
+            self.osd_status = status_future.result()
+            
+            self.osd_to_drive = self.match_drives_to_osds(self.drives, self.osds)
+            self.drive_to_osd = self.invert_osd_map(self.osd_to_drive)
+            self.systemd_status = self.check_systemd_status(self.osd_to_drive.keys())
+        finally:
+            # Don't wait for ceph queries still running after an early exit
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
         
         return {
             'timestamp': self.scan_timestamp,
@@ -900,12 +1516,22 @@ class OSDMonitor:
             'drives': self.drives,
             'osds': self.osds,
             'osd_to_drive': self.osd_to_drive,
+            'drive_to_osd': self.drive_to_osd,
             'osd_status': self.osd_status,
             'systemd_status': self.systemd_status,
             'osd_perf': self.osd_perf,
         }
     
     @staticmethod
+    def invert_osd_map(osd_to_drive):
+        """Build {serial: osd_id} from {osd_id: serial}; the first OSD wins on a clash."""
+        drive_to_osd = {}
+        for osd_id, serial in osd_to_drive.items():
+            drive_to_osd.setdefault(serial, osd_id)
+        return drive_to_osd
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
     def format_age(power_on_hours):
         """Format power-on hours as human readable age."""
         if not power_on_hours:
@@ -945,16 +1571,16 @@ class OSDMonitor:
         osd_status = data['osd_status']
         osd_perf = data['osd_perf']
         
-        # Check each drive
+        # scan() data carries the inverse map; build it for older/hand-made data
+        drive_to_osd = data.get('drive_to_osd') or OSDMonitor.invert_osd_map(osd_to_drive)
+        
+        # Check each drive; .get() works on Drive records and plain dicts
+        # (e.g. locate-drive's JSON scan cache) alike
         for serial, drive in drives.items():
-            smart = drive.get('smart_details', {})
+            smart = drive.get('smart_details') or {}
             
             # Find OSD for this drive
-            osd_id = None
-            for oid, drv_serial in osd_to_drive.items():
-                if drv_serial == serial:
-                    osd_id = oid
-                    break
+            osd_id = drive_to_osd.get(serial)
             
             # SMART issues
             if ((smart.get('reallocated_sectors') or 0) > 0 or 
@@ -1017,7 +1643,8 @@ if __name__ == "__main__":
     print("Testing OSD Core Module (Pure Python)")
     print("=" * 80)
     
-    monitor = OSDMonitor()
+    # Drive inventory rarely changes between runs; reuse it for up to an hour
+    monitor = OSDMonitor(inventory_ttl=3600)
     
     def progress(current, total, message):
         percent = (current / total) * 100
@@ -10,15 +10,54 @@ Usage:
 """
 
 import subprocess
+import json
 import os
+import re
 import sys
+from shutil import which
 
 VERSION = "1.0.1"
 
+# Section separator used throughout the report
+BAR = "=" * 80
+
+# smartctl probes are I/O-bound, so up to this many run side by side
+MAX_WORKERS = 16
+
+# lspci lines of RAID controllers ('raid' also covers 'megaraid')
+_LSPCI_RAID_RE = re.compile(r'raid|perc', re.IGNORECASE)
+
+# Identity text that marks an sg device as a RAID controller or enclosure
+# ('raid' also covers 'megaraid')
+_RAID_HINTS_RE = re.compile(r'raid|perc|enclosure', re.IGNORECASE)
+
+# Model substring -> controller type, checked in order so a specific PERC
+# model wins over the generic "perc"
+_CONTROLLER_SIGNATURES = (
+    ('h730', 'PERC H730'),
+    ('h830', 'PERC H830'),
+    ('h740', 'PERC H740'),
+    ('h840', 'PERC H840'),
+    ('perc', 'PERC (Unknown Model)'),
+    ('megaraid', 'MegaRAID/LSI'),
+    ('lsi', 'MegaRAID/LSI'),
+    ('3108', 'MegaRAID/LSI'),
+)
+
 def run_command(command, silent=False):
     """Run a shell command and return output."""
+    # stdout is block-buffered (see main()); show the report so far before waiting
+    sys.stdout.flush()
     try:
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
+        # stderr is only read to report failures, so silent calls discard it
+        # instead of paying for a second pipe
+        result = subprocess.run(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL if silent else subprocess.PIPE,
+            text=True,
+            check=True
+        )
         return result.stdout.strip()
     except subprocess.CalledProcessError as e:
         if not silent:
@@ -26,22 +65,106 @@ def run_command(command, silent=False):
             print(f"Error: {e.stderr}")
         return None
 
-def test_controllers():
-    """Test for RAID controllers."""
-    print("="*80)
-    print("RAID CONTROLLER DETECTION TEST")
-    print("="*80)
-    print()
+def run_commands(commands):
+    """
+    Run independent commands concurrently (silently); outputs come back in order.
+    
+    Each batch of up to MAX_WORKERS processes is started at once and then
+    collected, so no thread is needed per command. A failed command gives None,
+    as with run_command(silent=True).
+    """
+    sys.stdout.flush()
+    outputs = []
+    for start in range(0, len(commands), MAX_WORKERS):
+        procs = [
+            subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            for command in commands[start:start + MAX_WORKERS]
+        ]
+        for proc in procs:
+            stdout, _ = proc.communicate()
+            outputs.append(stdout.strip() if proc.returncode == 0 else None)
+    return outputs
+
+def parse_json(output):
+    """Decode `smartctl -j` output; None if there was none or it isn't JSON."""
+    if not output:
+        return None
+    try:
+        return json.loads(output)
+    except ValueError:
+        return None
+
+def smartctl_model(info):
+    """Model string from `smartctl -i -j` output: ATA model_name or SCSI product."""
+    return info.get('model_name') or info.get('scsi_product')
+
+def list_sg_devices():
+    """All /dev/sgN devices as sorted (N, path) pairs, from one listing of /dev."""
+    return sorted(
+        (int(entry.name[2:]), entry.path)
+        for entry in os.scandir('/dev')
+        if entry.name.startswith('sg') and entry.name[2:].isdigit()
+    )
+
+def scan_megaraid_slots():
+    """
+    List populated MegaRAID slots with one `smartctl --scan -d megaraid`.
+    
+    Returns:
+        dict: {scsi_host: set of PHY ids}, or None if the scan failed
+    """
+    output = run_command(["smartctl", "--scan", "-d", "megaraid", "-j"], silent=True)
+    if not output:
+        return None
+    try:
+        scan = json.loads(output)
+    except ValueError:
+        return None
     
-    # Method 1: Check lspci for controllers
-    print("Method 1: Checking PCI bus for RAID controllers...")
-    print()
+    # Drives are reported per SCSI host as /dev/bus/N, type megaraid,PHY
+    slots = {}
+    for dev in scan.get('devices', []):
+        bus = dev.get('name', '').removeprefix('/dev/bus/')
+        phy = dev.get('type', '').removeprefix('megaraid,')
+        if bus.isdigit() and phy.isdigit():
+            slots.setdefault(int(bus), set()).add(int(phy))
+    return slots
+
+def scsi_host(sg_dev):
+    """SCSI host number behind a /dev/sgN device (from sysfs), or None."""
+    link = os.path.realpath(f"/sys/class/scsi_generic/{os.path.basename(sg_dev)}/device")
+    host = os.path.basename(link).split(':')[0]
+    return int(host) if host.isdigit() else None
+
+def test_megaraid_access(sg_devs, megaraid_slots):
+    """
+    Check which sg devices answer MegaRAID passthrough commands.
+    
+    A device whose SCSI host already has drives in the `smartctl --scan`
+    results needs no probe of its own; the rest try drive 0, concurrently.
+    
+    Returns:
+        list: True/False per device, in sg_devs order
+    """
+    to_probe = [sg_dev for sg_dev in sg_devs if not megaraid_slots.get(scsi_host(sg_dev))]
+    probed = dict(zip(to_probe, run_commands([
+        ["smartctl", "-i", "-d", "megaraid,0", sg_dev]
+        for sg_dev in to_probe
+    ])))
+    
+    return [
+        sg_dev not in probed or bool(probed[sg_dev] and 'serial' in probed[sg_dev].lower())
+        for sg_dev in sg_devs
+    ]
+
+def find_pci_controllers():
+    """List (and print) the RAID controllers lspci shows on the PCI bus."""
     lspci_output = run_command(["lspci"], silent=True)
     pci_controllers = []
     
     if lspci_output:
-        for line in lspci_output.split('\n'):
-            if 'raid' in line.lower() or 'megaraid' in line.lower() or 'perc' in line.lower():
+        for line in lspci_output.splitlines():
+            if _LSPCI_RAID_RE.search(line):
                 print(f"  PCI Device: {line.strip()}")
                 pci_controllers.append(line.strip())
     
@@ -50,8 +173,25 @@ def test_controllers():
     else:
         print("  No RAID controllers found on PCI bus")
     
+    return pci_controllers
+
+def test_controllers():
+    """Test for RAID controllers."""
+    print(BAR)
+    print("RAID CONTROLLER DETECTION TEST")
+    print(BAR)
+    print()
+    
+    # Method 1: Check lspci for controllers
+    print("Method 1: Checking PCI bus for RAID controllers...")
+    print()
+    # The PCI list only matters when the sg scans find nothing, so lspci
+    # waits until then
+    print("  Deferred: only checked if Methods 2 and 3 find no controller")
+    pci_controllers = []
+    
     print()
-    print("="*80)
+    print(BAR)
     print()
     
     # Method 2: Scan /dev/sg* devices with smartctl
@@ -60,16 +200,19 @@ def test_controllers():
     
     controllers = []
     
-    # Try up to sg30 since you have many devices
-    for i in range(31):
-        sg_dev = f"/dev/sg{i}"
-        
-        if not os.path.exists(sg_dev):
-            continue
-        
+    # Only the sg devices that actually exist, however many there are
+    sg_devices = list_sg_devices()
+    sg_present = {i for i, sg_dev in sg_devices}
+    
+    # Query every device at once, then check the results in order
+    infos = [parse_json(output) for output in
+             run_commands([["smartctl", "-i", "-j", sg_dev] for i, sg_dev in sg_devices])]
+    
+    # Kept for every device, RAID or not, so Method 3 doesn't ask again
+    info_cache = {sg_dev: info for (i, sg_dev), info in zip(sg_devices, infos)}
+    
+    for (i, sg_dev), info in zip(sg_devices, infos):
         # Check if it's a RAID controller
-        info = run_command(["smartctl", "-i", sg_dev], silent=True)
-        
         if not info:
             continue
         
@@ -78,46 +221,28 @@ def test_controllers():
         controller_type = "Unknown"
         controller_model = "Unknown"
         
-        # Look for RAID indicators in the output
-        info_lower = info.lower()
+        # Look for RAID indicators in the identity fields and device type
+        model = smartctl_model(info)
+        identity = ' '.join(filter(None, (
+            info.get('scsi_vendor'),
+            model,
+            info.get('device_type', {}).get('name'),
+        )))
         
-        # Check for explicit RAID controller indicators
-        if 'megaraid' in info_lower or 'perc' in info_lower:
-            is_raid = True
-        
-        # Also check device type
-        if 'enclosure' in info_lower or 'raid' in info_lower:
+        if _RAID_HINTS_RE.search(identity):
             is_raid = True
         
         # Parse model information
-        for line in info.split('\n'):
-            line_lower = line.lower()
+        if model:
+            controller_model = model
             
-            # Extract model information
-            if 'product' in line_lower or 'device model' in line_lower:
-                if ':' in line:
-                    model = line.split(':', 1)[1].strip()
-                    controller_model = model
-                    
-                    # Identify specific types
-                    if 'h730' in model.lower():
-                        controller_type = 'PERC H730'
-                        is_raid = True
-                    elif 'h830' in model.lower():
-                        controller_type = 'PERC H830'
-                        is_raid = True
-                    elif 'h740' in model.lower():
-                        controller_type = 'PERC H740'
-                        is_raid = True
-                    elif 'h840' in model.lower():
-                        controller_type = 'PERC H840'
-                        is_raid = True
-                    elif 'perc' in model.lower():
-                        controller_type = 'PERC (Unknown Model)'
-                        is_raid = True
-                    elif 'megaraid' in model.lower() or 'lsi' in model.lower() or '3108' in model.lower():
-                        controller_type = 'MegaRAID/LSI'
-                        is_raid = True
+            # Identify specific types
+            model_lower = model.lower()
+            for signature, signature_type in _CONTROLLER_SIGNATURES:
+                if signature in model_lower:
+                    controller_type = signature_type
+                    is_raid = True
+                    break
         
         if is_raid:
             controllers.append({
@@ -137,7 +262,7 @@ def test_controllers():
         print("  No controllers found via /dev/sg* scanning")
     
     print()
-    print("="*80)
+    print(BAR)
     print()
     
     # Method 3: Try to find controller by testing megaraid access
@@ -146,17 +271,17 @@ def test_controllers():
     
     working_controllers = []
     
+    # One scan lists every populated MegaRAID slot; it spares most of the
+    # per-device probes here and in the drive scan test below
+    megaraid_slots = scan_megaraid_slots() or {}
+    
     # If we found controllers via smartctl, test them
     if controllers:
-        for ctrl in controllers:
+        responds = test_megaraid_access([ctrl['device'] for ctrl in controllers], megaraid_slots)
+        
+        for ctrl, ok in zip(controllers, responds):
             sg_dev = ctrl['device']
-            # Try to access drive 0 through this controller
-            test_result = run_command(
-                ["smartctl", "-i", "-d", "megaraid,0", sg_dev],
-                silent=True
-            )
-            
-            if test_result and 'serial' in test_result.lower():
+            if ok:
                 print(f"✓ {sg_dev} responds to megaraid commands")
                 working_controllers.append(ctrl)
             else:
@@ -166,31 +291,22 @@ def test_controllers():
     if not working_controllers:
         print("  Testing common /dev/sg devices for megaraid access...")
         # Try sg24 (often controller) and a few others
-        test_devices = [24, 0, 1, 2, 25, 26, 27]
+        test_devices = [i for i in (24, 0, 1, 2, 25, 26, 27) if i in sg_present]
+        
+        responds = test_megaraid_access([f"/dev/sg{i}" for i in test_devices], megaraid_slots)
         
-        for i in test_devices:
+        for i, ok in zip(test_devices, responds):
             sg_dev = f"/dev/sg{i}"
-            if not os.path.exists(sg_dev):
-                continue
-                
-            test_result = run_command(
-                ["smartctl", "-i", "-d", "megaraid,0", sg_dev],
-                silent=True
-            )
-            
-            if test_result and 'serial' in test_result.lower():
+            if ok:
                 print(f"  ✓ {sg_dev} responds to megaraid commands!")
                 
-                # Try to identify the controller
-                ctrl_info = run_command(["smartctl", "-i", sg_dev], silent=True)
+                # Try to identify the controller (Method 2 already queried it)
+                ctrl_info = info_cache.get(sg_dev)
                 controller_model = "Unknown"
                 controller_type = "MegaRAID/LSI"
                 
-                if ctrl_info:
-                    for line in ctrl_info.split('\n'):
-                        if 'product' in line.lower() or 'device model' in line.lower():
-                            if ':' in line:
-                                controller_model = line.split(':', 1)[1].strip()
+                if ctrl_info and smartctl_model(ctrl_info):
+                    controller_model = smartctl_model(ctrl_info)
                 
                 working_controllers.append({
                     'device': sg_dev,
@@ -200,11 +316,19 @@ def test_controllers():
                 })
     
     print()
-    print("="*80)
+    print(BAR)
+    
+    if not working_controllers and not controllers:
+        print()
+        print("Method 1 (deferred): Checking PCI bus for RAID controllers...")
+        print()
+        pci_controllers = find_pci_controllers()
+        print()
+        print(BAR)
     
-    print("="*80)
+    print(BAR)
     print("SUMMARY")
-    print("="*80)
+    print(BAR)
     print()
     
     # Use working_controllers if we found any, otherwise fall back to controllers
@@ -248,9 +372,8 @@ def test_controllers():
         # Try to give specific device recommendations
         print("Recommended test commands:")
         for i in [24, 25, 26, 27, 0]:
-            sg_dev = f"/dev/sg{i}"
-            if os.path.exists(sg_dev):
-                print(f"  sudo smartctl -i -d megaraid,0 {sg_dev}")
+            if i in sg_present:
+                print(f"  sudo smartctl -i -d megaraid,0 /dev/sg{i}")
         
         return False
     
@@ -261,9 +384,9 @@ def test_controllers():
         print(f"  {ctrl['device']}: {ctrl['type']}")
     
     print()
-    print("="*80)
+    print(BAR)
     print("EXPECTED BEHAVIOR")
-    print("="*80)
+    print(BAR)
     print()
     
     if len(final_controllers) == 1:
@@ -292,24 +415,35 @@ def test_controllers():
         print("⚠️  UPGRADE RECOMMENDED!")
     
     print()
-    print("="*80)
+    print(BAR)
     print("DRIVE SCAN TEST")
-    print("="*80)
+    print(BAR)
     print()
     
     total_drives = 0
     
+    # Counts come from the MegaRAID scan; per-slot probes are the fallback
     for ctrl in final_controllers:
         print(f"Testing {ctrl['device']} ({ctrl['type']})...")
         drives_found = 0
         
-        # Quick test - just check first 10 slots
-        for phy_id in range(10):
-            info = run_command(
-                ["smartctl", "-j", "-a", "-d", f"megaraid,{phy_id}", ctrl['device']],
-                silent=True
-            )
-            
+        scanned = megaraid_slots.get(scsi_host(ctrl['device']))
+        if scanned:
+            drives_found = len(scanned)
+            print(f"  ✓ smartctl --scan reports {drives_found} drive(s) in slot(s) "
+                  f"{', '.join(str(phy_id) for phy_id in sorted(scanned))}")
+            total_drives += drives_found
+            print()
+            continue
+        
+        # Quick test - just check first 10 slots, all at once
+        # (identity only; the serial number is all we look for)
+        infos = run_commands([
+            ["smartctl", "-j", "-i", "-d", f"megaraid,{phy_id}", ctrl['device']]
+            for phy_id in range(10)
+        ])
+        
+        for info in infos:
             if info and 'serial_number' in info:
                 drives_found += 1
         
@@ -338,9 +472,9 @@ def test_controllers():
         print("Full scan will provide complete inventory.")
     
     print()
-    print("="*80)
+    print(BAR)
     print("NEXT STEPS")
-    print("="*80)
+    print(BAR)
     print()
     
     if len(final_controllers) > 1:
@@ -369,21 +503,24 @@ def test_controllers():
     return True
 
 def main():
+    # The report is many short lines; write it in blocks rather than
+    # one write() per line (run_command flushes before each wait)
+    sys.stdout.reconfigure(line_buffering=False)
+    
     if os.geteuid() != 0:
-        print("="*80)
+        print(BAR)
         print("ERROR: This script must be run with sudo")
-        print("="*80)
+        print(BAR)
         print()
         print("Usage: sudo python3 test-controllers.py")
         print()
         sys.exit(1)
     
     # Check for smartctl
-    smartctl_check = run_command(["which", "smartctl"], silent=True)
-    if not smartctl_check:
-        print("="*80)
+    if which("smartctl") is None:
+        print(BAR)
         print("ERROR: smartctl not found")
-        print("="*80)
+        print(BAR)
         print()
         print("Please install smartmontools:")
         print("  Ubuntu/Debian: sudo apt install smartmontools")
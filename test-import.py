@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
 Debug script to test osd_core import and show actual error
+
+Usage:
+    python3 test-import.py [module ...]      (default: osd_core)
 """
 
 import sys
@@ -13,19 +16,24 @@ print("Python version:", sys.version)
 print("Python path:", sys.path)
 print()
 
-module_name = sys.argv[1]
+# Write __pycache__ even under PYTHONDONTWRITEBYTECODE, so the imports
+# below also warm the bytecode cache for the real runs
+sys.dont_write_bytecode = False
 
-try:
-    print(f"[{VERSION}] Attempting to import {module_name}...")
-    module = importlib.import_module(module_name)
-    print("✓ Import successful!")
-    print(f"Available in module:", dir(module))
-except ImportError as e:
-    print(f"[{VERSION}] ✗ ImportError in {module_name}.py:", e)
-    traceback.print_exc()
-except SyntaxError as e:
-    print(f"[{VERSION}] ✗ SyntaxError in {module_name}.py:", e)
-    traceback.print_exc()
-except Exception as e:
-    print(f"[{VERSION}] ✗ Unexpected error {e}")
-    traceback.print_exc()
\ No newline at end of file
+# Several modules can be checked in one interpreter; osd_core by default
+for module_name in sys.argv[1:] or ['osd_core']:
+    try:
+        print(f"[{VERSION}] Attempting to import {module_name}...")
+        module = importlib.import_module(module_name)
+        print("✓ Import successful!")
+        print(f"Available in module:", dir(module))
+    except ImportError as e:
+        print(f"[{VERSION}] ✗ ImportError in {module_name}.py:", e)
+        traceback.print_exc()
+    except SyntaxError as e:
+        print(f"[{VERSION}] ✗ SyntaxError in {module_name}.py:", e)
+        traceback.print_exc()
+    except Exception as e:
+        print(f"[{VERSION}] ✗ Unexpected error {e}")
+        traceback.print_exc()
+    print()